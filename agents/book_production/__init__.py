@@ -19,41 +19,100 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under Fair Source 0.9
 """
 
-from .base import AgentConfig, BaseAgent, MemDocsConfig, OpusAgent, RedisConfig, SonnetAgent
-from .editor_agent import EditorAgent
-from .learning import (  # Pattern Extraction; Feedback Loop; Quality Gap Detection; SBAR Handoffs
-    ExtractedPattern,
-    FeedbackEntry,
-    FeedbackLoop,
-    GapSeverity,
-    HandoffType,
-    PatternExtractor,
-    QualityGap,
-    QualityGapDetector,
-    SBARHandoff,
-    create_editor_to_reviewer_handoff,
-    create_research_to_writer_handoff,
-    create_reviewer_to_writer_handoff,
-    create_writer_to_editor_handoff,
-)
-from .pipeline import BookProductionPipeline, PipelineConfig, produce_chapter
-from .research_agent import ResearchAgent
-from .reviewer_agent import ReviewerAgent
-from .state import (
-    AgentPhase,
-    Chapter,
-    ChapterProductionState,
-    ChapterSpec,
-    Draft,
-    DraftVersion,
-    EditResult,
-    QualityScore,
-    ResearchResult,
-    ReviewResult,
-    SourceDocument,
-    create_initial_state,
-)
-from .writer_agent import WriterAgent
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import (
+        AgentConfig,
+        BaseAgent,
+        MemDocsConfig,
+        OpusAgent,
+        RedisConfig,
+        SonnetAgent,
+    )
+    from .editor_agent import EditorAgent
+    from .learning import (
+        ExtractedPattern,
+        FeedbackEntry,
+        FeedbackLoop,
+        GapSeverity,
+        HandoffType,
+        PatternExtractor,
+        QualityGap,
+        QualityGapDetector,
+        SBARHandoff,
+        create_editor_to_reviewer_handoff,
+        create_research_to_writer_handoff,
+        create_reviewer_to_writer_handoff,
+        create_writer_to_editor_handoff,
+    )
+    from .pipeline import (
+        BookProductionPipeline,
+        PipelineConfig,
+        produce_chapter,
+    )
+    from .research_agent import ResearchAgent
+    from .reviewer_agent import ReviewerAgent
+    from .state import (
+        AgentPhase,
+        Chapter,
+        ChapterProductionState,
+        ChapterSpec,
+        Draft,
+        DraftVersion,
+        EditResult,
+        QualityScore,
+        ResearchResult,
+        ReviewResult,
+        SourceDocument,
+        create_initial_state,
+    )
+    from .writer_agent import WriterAgent
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing one lightweight name such as
+# ChapterSpec does not pull in the agents, LLM clients and LangGraph.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AgentConfig": ".base",
+    "BaseAgent": ".base",
+    "MemDocsConfig": ".base",
+    "OpusAgent": ".base",
+    "RedisConfig": ".base",
+    "SonnetAgent": ".base",
+    "EditorAgent": ".editor_agent",
+    "ExtractedPattern": ".learning",
+    "FeedbackEntry": ".learning",
+    "FeedbackLoop": ".learning",
+    "GapSeverity": ".learning",
+    "HandoffType": ".learning",
+    "PatternExtractor": ".learning",
+    "QualityGap": ".learning",
+    "QualityGapDetector": ".learning",
+    "SBARHandoff": ".learning",
+    "create_editor_to_reviewer_handoff": ".learning",
+    "create_research_to_writer_handoff": ".learning",
+    "create_reviewer_to_writer_handoff": ".learning",
+    "create_writer_to_editor_handoff": ".learning",
+    "BookProductionPipeline": ".pipeline",
+    "PipelineConfig": ".pipeline",
+    "produce_chapter": ".pipeline",
+    "ResearchAgent": ".research_agent",
+    "ReviewerAgent": ".reviewer_agent",
+    "AgentPhase": ".state",
+    "Chapter": ".state",
+    "ChapterProductionState": ".state",
+    "ChapterSpec": ".state",
+    "Draft": ".state",
+    "DraftVersion": ".state",
+    "EditResult": ".state",
+    "QualityScore": ".state",
+    "ResearchResult": ".state",
+    "ReviewResult": ".state",
+    "SourceDocument": ".state",
+    "create_initial_state": ".state",
+    "WriterAgent": ".writer_agent",
+}
 
 __all__ = [
     # Configuration
@@ -107,3 +166,18 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public names lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
@@ -7,12 +7,26 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under Fair Source 0.9
 """
 
-from .code_health_adapter import CodeHealthAdapter
-from .code_review_adapter import CodeReviewAdapter
-from .debugging_adapter import DebuggingAdapter
-from .security_adapter import SecurityAdapter
-from .tech_debt_adapter import TechDebtAdapter
-from .test_quality_adapter import TestQualityAdapter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .code_health_adapter import CodeHealthAdapter
+    from .code_review_adapter import CodeReviewAdapter
+    from .debugging_adapter import DebuggingAdapter
+    from .security_adapter import SecurityAdapter
+    from .tech_debt_adapter import TechDebtAdapter
+    from .test_quality_adapter import TestQualityAdapter
+
+# Adapter name -> submodule defining it, imported on first access (PEP 562)
+_LAZY_IMPORTS: dict[str, str] = {
+    "CodeHealthAdapter": ".code_health_adapter",
+    "CodeReviewAdapter": ".code_review_adapter",
+    "DebuggingAdapter": ".debugging_adapter",
+    "SecurityAdapter": ".security_adapter",
+    "TechDebtAdapter": ".tech_debt_adapter",
+    "TestQualityAdapter": ".test_quality_adapter",
+}
 
 __all__ = [
     "CodeHealthAdapter",
@@ -22,3 +36,18 @@ __all__ = [
     "TechDebtAdapter",
     "TestQualityAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve adapter classes lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,126 @@
+"""Lightweight finding record used by the inspection adapters.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Use orjson for writing findings when available
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+@dataclass(slots=True)
+class Finding:
+    """A single adapter finding.
+
+    Slotted to keep per-finding memory small while a scan is running;
+    converted to the dict form expected by ToolResult with as_dict().
+    finding_id is normally assigned by FindingSink in report order, so
+    IDs follow a stable order however the scan was scheduled.
+    """
+
+    tool: str
+    category: str
+    severity: str
+    file_path: str
+    line_number: int | None
+    code: str
+    message: str
+    evidence: str
+    confidence: float
+    fixable: bool = False
+    fix_command: str | None = None
+    remediation: str = ""
+    finding_id: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the finding as a ToolResult finding dict."""
+        return {
+            "finding_id": self.finding_id,
+            "tool": self.tool,
+            "category": self.category,
+            "severity": self.severity,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+            "code": self.code,
+            "message": self.message,
+            "evidence": self.evidence,
+            "confidence": self.confidence,
+            "fixable": self.fixable,
+            "fix_command": self.fix_command,
+            "remediation": self.remediation,
+        }
+
+
+class FindingSink:
+    """Numbers findings in report order and keeps or streams them.
+
+    Without an output path, findings are kept as dicts for the ToolResult.
+    With one, each finding is written to it as a JSON line once numbered
+    and then dropped, so memory stays flat however many findings a scan
+    produces; findings() is then empty, count is the only tally and
+    metadata() names the file so readers know where the findings went.
+
+    The file is opened for appending and each batch goes out in a single
+    write, so adapters sharing one output path add to it without
+    clobbering or interleaving each other's lines.
+    """
+
+    def __init__(self, output_path: str | os.PathLike[str] | None = None):
+        """Initialize the sink.
+
+        Args:
+            output_path: JSONL file to stream findings to (default: keep them)
+
+        """
+        self.output_path = output_path
+        self.count = 0
+        self._findings: list[dict[str, Any]] = []
+        self._file = open(output_path, "ab", buffering=0) if output_path else None
+
+    def __enter__(self) -> "FindingSink":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def extend(self, findings: Iterable[Finding], id_prefix: str) -> None:
+        """Number findings as "<id_prefix><n>" and keep or write them."""
+        lines: list[bytes] = []
+        for finding in findings:
+            finding.finding_id = f"{id_prefix}{self.count}"
+            self.count += 1
+            if self._file is None:
+                self._findings.append(finding.as_dict())
+            else:
+                lines.append(_json_dumps(finding.as_dict()) + b"\n")
+        if lines:
+            self._file.write(b"".join(lines))
+
+    def findings(self) -> list[dict[str, Any]]:
+        """Return the kept findings (empty when streaming to a file)."""
+        return self._findings
+
+    def metadata(self) -> dict[str, Any]:
+        """Return ToolResult metadata naming the stream file, if any."""
+        if self.output_path is None:
+            return {}
+        return {"findings_path": os.fspath(self.output_path)}
+
+    def close(self) -> None:
+        """Close the output file, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,71 @@
+"""Shared file discovery and exclusion rules for the inspection adapters.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+# Directory names never scanned
+EXCLUDED_DIRS = frozenset(
+    {
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+        "build",
+        "dist",
+    },
+)
+
+
+def iter_py_files(root: Path) -> Iterator[Path]:
+    """Yield Python files under root, skipping excluded directories.
+
+    Walks with os.scandir and an explicit stack, pruning excluded
+    directories before they are opened, so large trees such as
+    virtualenvs and node_modules are never descended into. Symlinked
+    directories are not followed, and directories that cannot be read
+    are skipped, matching os.walk.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
+def root_prefix(root: Path) -> str:
+    """Return root as a string ending in a path separator."""
+    return os.path.join(os.fspath(root), "")
+
+
+def relative_path(path: Path, root: Path, prefix: str) -> str:
+    """Return path relative to root, as a string.
+
+    Paths yielded by iter_py_files(root) start with root's string form, so
+    slicing off the precomputed root_prefix(root) avoids building a Path per
+    file. Path normalization can drop a leading "./" from a relative root,
+    in which case this falls back to relative_to.
+    """
+    path_str = os.fspath(path)
+    if path_str.startswith(prefix):
+        return path_str[len(prefix) :]
+    return str(path.relative_to(root))
@@ -0,0 +1,47 @@
+"""Shared worker process pools for CPU-bound adapter scans.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import atexit
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+# One pool per adapter, created on first use and kept alive across
+# analyze() runs so each worker's scanner stays warm
+_pools: dict[str, ProcessPoolExecutor] = {}
+
+
+def get_process_pool(name: str, initializer: Callable[[], Any]) -> ProcessPoolExecutor:
+    """Return the named process pool, creating it if needed.
+
+    Args:
+        name: Pool name, one per adapter
+        initializer: Run once in each worker at startup, e.g. to build the
+            worker's scanner before its first file
+
+    """
+    pool = _pools.get(name)
+    if pool is None:
+        if not _pools:
+            atexit.register(shutdown_process_pools)
+        pool = _pools[name] = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=initializer,
+        )
+    return pool
+
+
+def shutdown_process_pools() -> None:
+    """Shut down every adapter process pool that was started.
+
+    Registered with atexit when the first pool is created; long-running
+    callers may also call it to release the worker processes early.
+    """
+    atexit.unregister(shutdown_process_pools)
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown(wait=True, cancel_futures=True)
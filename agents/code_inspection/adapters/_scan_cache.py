@@ -0,0 +1,197 @@
+"""Content-Hash Scan Cache
+
+Persists per-file scan results keyed by a hash of the file contents, so
+unchanged files can skip re-scanning on later runs.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import functools
+import hashlib
+import importlib.util
+import json
+import logging
+import sqlite3
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _package_version() -> str:
+    """Return the installed framework version, used to invalidate old entries."""
+    try:
+        return metadata.version("empathy-framework")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@functools.cache
+def _source_fingerprint(module_names: tuple[str, ...]) -> str:
+    """Hash the source of the modules that produce a tool's results.
+
+    Editable and source checkouts keep the same package version while the
+    scanner rules change, so the version alone can't invalidate entries.
+    Modules that can't be found contribute a fixed marker.
+    """
+    hasher = hashlib.blake2b(digest_size=8)
+    for name in module_names:
+        hasher.update(name.encode("utf-8"))
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None or not spec.origin or not spec.has_location:
+            hasher.update(b"\0missing")
+            continue
+        try:
+            hasher.update(Path(spec.origin).read_bytes())
+        except OSError:
+            hasher.update(b"\0unreadable")
+    return hasher.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (~/.empathy/cache).
+
+    Kept outside the scanned project so a read-only inspection never writes
+    into the tree it inspects. Entries are keyed by content digest, so
+    projects can share it safely.
+    """
+    return Path.home() / ".empathy" / "cache"
+
+
+def cache_version(module_names: tuple[str, ...] = ()) -> str:
+    """Cache version for a tool: framework version plus analyzer source hash."""
+    version = _package_version()
+    if module_names:
+        version = f"{version}+{_source_fingerprint(module_names)}"
+    return version
+
+
+class ScanCache:
+    """SQLite-backed cache of scan results keyed by file content digest.
+
+    Entries are scoped by tool name and version, so upgrading the framework
+    or editing the scanner never serves stale results (see cache_version). Writes are buffered in memory
+    and committed in one batch by flush().
+
+    Example:
+        cache = ScanCache(default_cache_dir(), tool="security")
+        digest = ScanCache.digest(path.read_bytes())
+        results = cache.get(digest)
+        if results is None:
+            results = scan(path)
+            cache.set(digest, results)
+        cache.flush()
+
+    """
+
+    def __init__(self, cache_dir: Path, tool: str, version: str | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            tool: Name of the tool whose results are cached
+            version: Tool version (default: installed framework version)
+
+        """
+        self.tool = tool
+        self.version = version or _package_version()
+        self.db_path = cache_dir / "scan_cache.db"
+        self._pending: dict[str, str] = {}
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scan_results (
+                tool TEXT NOT NULL,
+                version TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                results TEXT NOT NULL,
+                PRIMARY KEY (tool, version, digest)
+            )
+            """,
+        )
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Compute the cache key for a file's contents."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, digest: str) -> list[Any] | None:
+        """Return cached results for a digest, or None on a miss."""
+        pending = self._pending.get(digest)
+        if pending is not None:
+            return json.loads(pending)
+
+        row = self._conn.execute(
+            "SELECT results FROM scan_results WHERE tool = ? AND version = ? AND digest = ?",
+            (self.tool, self.version, digest),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, digest: str, results: list[Any]) -> None:
+        """Buffer results for a digest; results must be JSON-serializable."""
+        try:
+            self._pending[digest] = json.dumps(results)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching unserializable scan results: {e}")
+
+    def flush(self) -> None:
+        """Write buffered results to disk."""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scan_results (tool, version, digest, results) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (self.tool, self.version, digest, results)
+                    for digest, results in self._pending.items()
+                ],
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush pending results and close the database."""
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+
+def open_scan_cache(
+    config: dict[str, Any],
+    tool: str,
+    analyzer_modules: tuple[str, ...] = (),
+) -> ScanCache | None:
+    """Open an adapter's result cache, or None if disabled/unavailable.
+
+    Honors the adapter config keys ``use_cache`` (default True) and
+    ``cache_dir`` (default default_cache_dir()). Entries are keyed
+    by the source of ``analyzer_modules``, so editing those modules
+    invalidates them.
+    """
+    if not config.get("use_cache", True):
+        return None
+    cache_dir = Path(config.get("cache_dir") or default_cache_dir())
+    try:
+        return ScanCache(cache_dir, tool=tool, version=cache_version(analyzer_modules))
+    except (OSError, sqlite3.Error) as e:
+        # Read-only checkout or similar - scan without caching
+        logger.warning(f"Scan cache unavailable at {cache_dir}: {e}")
+        return None
+
+
+def close_scan_cache(cache: ScanCache | None) -> None:
+    """Persist and close a result cache, never failing the scan."""
+    if cache is None:
+        return
+    try:
+        cache.close()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Could not save scan cache: {e}")
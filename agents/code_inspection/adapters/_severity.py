@@ -0,0 +1,36 @@
+"""Shared severity constants for the inspection adapters.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+# Unified severity levels, most to least severe. Per-adapter penalty
+# vectors are aligned with this order.
+SEVERITY_ORDER = ("critical", "high", "medium", "low", "info")
+
+# Position of each severity in SEVERITY_ORDER, used to index count vectors
+SEVERITY_INDEX = {severity: index for index, severity in enumerate(SEVERITY_ORDER)}
+
+
+def with_case_variants(mapping: dict[str, int]) -> dict[str, int]:
+    """Return a copy of a lowercase-keyed map with UPPER and Title keys added.
+
+    Tools report severities as "high", "HIGH" or "High"; keying all three
+    lets lookup_severity resolve them without lowercasing each one.
+    """
+    variants: dict[str, int] = {}
+    for name, index in mapping.items():
+        variants[name] = variants[name.upper()] = variants[name.capitalize()] = index
+    return variants
+
+
+def lookup_severity(mapping: dict[str, int], severity: str, default: int) -> int:
+    """Map a tool's severity name to a SEVERITY_ORDER index.
+
+    mapping should come from with_case_variants; other casings fall back
+    to a lowercased lookup.
+    """
+    index = mapping.get(severity)
+    if index is None:
+        index = mapping.get(severity.lower(), default)
+    return index
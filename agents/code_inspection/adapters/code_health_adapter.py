@@ -45,7 +45,7 @@ class CodeHealthAdapter:
             ToolResult with aggregated findings
 
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Import here to handle optional dependency
@@ -99,7 +99,7 @@ class CodeHealthAdapter:
                     }
                     findings.append(finding)
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             return ToolResult(
                 tool_name="code_health",
@@ -124,9 +124,9 @@ class CodeHealthAdapter:
             )
 
         except ImportError:
-            return self._create_skip_result("code_health module not available", start_time)
+            return self._create_skip_result("code_health module not available", start_ns)
         except Exception as e:
-            return self._create_error_result(str(e), start_time)
+            return self._create_error_result(str(e), start_ns)
 
     def _map_severity(self, severity: str) -> str:
         """Map code_health severity to unified severity."""
@@ -138,7 +138,7 @@ class CodeHealthAdapter:
         }
         return mapping.get(severity.lower(), "medium")
 
-    def _create_skip_result(self, reason: str, start_time: float) -> ToolResult:
+    def _create_skip_result(self, reason: str, start_ns: int) -> ToolResult:
         """Create a skip result."""
         return ToolResult(
             tool_name="code_health",
@@ -147,12 +147,12 @@ class CodeHealthAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={"skip_reason": reason},
             error_message="",
         )
 
-    def _create_error_result(self, error: str, start_time: float) -> ToolResult:
+    def _create_error_result(self, error: str, start_ns: int) -> ToolResult:
         """Create an error result."""
         return ToolResult(
             tool_name="code_health",
@@ -161,7 +161,7 @@ class CodeHealthAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={},
             error_message=error,
         )
@@ -12,10 +12,12 @@ Licensed under Fair Source 0.9
 
 import time
 from collections import defaultdict
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from ..state import ToolResult
+from ._paths import iter_py_files
 
 # Language detection mapping
 EXTENSION_TO_LANGUAGE = {
@@ -96,7 +98,7 @@ class CodeReviewAdapter:
             ToolResult with code review findings
 
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Import here to handle optional dependency
@@ -109,15 +111,11 @@ class CodeReviewAdapter:
             files_to_review = target_files or []
             if not files_to_review:
                 # Default to Python files in project
+                # Limit to 50 files for performance - islice stops the walk early
                 files_to_review = [
                     str(f.relative_to(self.project_root))
-                    for f in self.project_root.rglob("*.py")
-                    if not any(
-                        p in f.parts for p in ["node_modules", ".venv", "__pycache__", ".git"]
-                    )
-                ][
-                    :50
-                ]  # Limit to 50 files for performance
+                    for f in islice(iter_py_files(self.project_root), 50)
+                ]
 
             # Group files by language for language-aware review
             files_by_language: dict[str, list[str]] = defaultdict(list)
@@ -204,7 +202,7 @@ class CodeReviewAdapter:
             score = self._calculate_score(findings_by_severity)
             status = "pass" if score >= 85 else "warn" if score >= 70 else "fail"
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Extract metadata from wizard's summary
             summary = report.get("summary", {})
@@ -230,9 +228,9 @@ class CodeReviewAdapter:
             )
 
         except ImportError:
-            return self._create_skip_result("code_review_wizard module not available", start_time)
+            return self._create_skip_result("code_review_wizard module not available", start_ns)
         except Exception as e:
-            return self._create_error_result(str(e), start_time)
+            return self._create_error_result(str(e), start_ns)
 
     def _map_severity(self, severity: str) -> str:
         """Map review severity to unified severity."""
@@ -268,7 +266,7 @@ class CodeReviewAdapter:
         # Cap penalty at 60 to ensure minimum score of 40 with many findings
         return max(40, 100 - int(min(total_penalty, 60)))
 
-    def _create_skip_result(self, reason: str, start_time: float) -> ToolResult:
+    def _create_skip_result(self, reason: str, start_ns: int) -> ToolResult:
         """Create a skip result."""
         return ToolResult(
             tool_name="code_review",
@@ -277,12 +275,12 @@ class CodeReviewAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={"skip_reason": reason},
             error_message="",
         )
 
-    def _create_error_result(self, error: str, start_time: float) -> ToolResult:
+    def _create_error_result(self, error: str, start_ns: int) -> ToolResult:
         """Create an error result."""
         return ToolResult(
             tool_name="code_review",
@@ -291,7 +289,7 @@ class CodeReviewAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={},
             error_message=error,
         )
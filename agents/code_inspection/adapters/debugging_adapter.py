@@ -7,11 +7,70 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under Fair Source 0.9
 """
 
+import asyncio
+import json
+import os
+import re
 import time
 from pathlib import Path
 from typing import Any
 
 from ..state import HistoricalMatch, ToolResult
+from ._finding import Finding, FindingSink
+from ._severity import (
+    SEVERITY_INDEX,
+    SEVERITY_ORDER,
+    lookup_severity,
+    with_case_variants,
+)
+
+# Score penalty per finding, aligned with SEVERITY_ORDER
+SEVERITY_PENALTIES = (20, 12, 5, 1, 0)
+
+# Wizard severity name -> SEVERITY_ORDER index
+_SEVERITY_MAP = with_case_variants({**SEVERITY_INDEX, "warning": SEVERITY_INDEX["medium"]})
+
+# Error types that always mark a historical bug as high severity
+_CRITICAL_ERROR_TYPES = re.compile(r"null|security|crash|injection", re.IGNORECASE)
+
+# Use orjson for pattern parsing when available (its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is unchanged)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _list_pattern_files(patterns_dir: Path) -> list[os.DirEntry]:
+    """List bug_*.json pattern files in a directory, smallest first.
+
+    A single scandir pass with plain string checks avoids glob's per-entry
+    fnmatch; reading small files first keeps early reads cheap.
+    """
+    with os.scandir(patterns_dir) as it:
+        entries = [
+            entry
+            for entry in it
+            if entry.name.startswith("bug_") and entry.name.endswith(".json") and entry.is_file()
+        ]
+    entries.sort(key=_entry_size)
+    return entries
+
+
+def _entry_size(entry: os.DirEntry) -> int:
+    """Return a directory entry's size, or 0 if it cannot be stat'ed."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
+
+def _load_pattern(path: str) -> dict[str, Any]:
+    """Read and parse a single bug pattern file."""
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
 
 
 class DebuggingAdapter:
@@ -47,89 +106,102 @@ class DebuggingAdapter:
             ToolResult with historical matches and recommendations
 
         """
-        import json
-
-        start_time = time.time()
-
-        findings: list[dict[str, Any]] = []
-        findings_by_severity: dict[str, int] = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "info": 0,
-        }
+        start_ns = time.perf_counter_ns()
+
+        findings: list[Finding] = []
+        # Counts per severity, indexed like SEVERITY_ORDER
+        severity_counts = [0] * len(SEVERITY_ORDER)
         historical_matches: list[HistoricalMatch] = []
 
         # Scan patterns directory for unresolved bugs
         patterns_dir = self.project_root / "patterns" / "debugging"
         patterns_checked = 0
 
-        if patterns_dir.exists():
-            for pattern_file in patterns_dir.glob("bug_*.json"):
-                patterns_checked += 1
-                try:
-                    with open(pattern_file) as f:
-                        pattern = json.load(f)
-
-                    # Only include unresolved patterns as findings
-                    status_val = pattern.get("status", "investigating")
-                    if status_val == "resolved":
-                        continue
-
-                    severity = self._get_severity_from_match(pattern)
-                    findings_by_severity[severity] += 1
-
-                    finding = {
-                        "finding_id": f"md_{len(findings)}",
-                        "tool": "memory_debugging",
-                        "category": "debugging",
-                        "severity": severity,
-                        "file_path": pattern.get("file_path", ""),
-                        "line_number": pattern.get("line_number"),
-                        "code": pattern.get("error_type", "UNRESOLVED_BUG"),
-                        "message": f"Unresolved bug: {pattern.get('error_type', 'unknown')}",
-                        "evidence": pattern.get("error_message", ""),
-                        "confidence": 0.9,
-                        "fixable": False,
-                        "fix_command": None,
-                        "remediation": pattern.get("suggested_fix", ""),
-                    }
-                    findings.append(finding)
-
-                    historical_matches.append(
-                        HistoricalMatch(
-                            pattern_id=pattern_file.stem,
-                            error_type=pattern.get("error_type", ""),
-                            similarity_score=0.9,
-                            file_path=pattern.get("file_path", ""),
-                            matched_code=pattern.get("error_message", ""),
-                            historical_fix=pattern.get("suggested_fix", ""),
-                            resolution_time_minutes=0,
-                        ),
-                    )
-                except (json.JSONDecodeError, KeyError, OSError):
+        if patterns_dir.is_dir():
+            # Load pattern files concurrently, then process them in one pass
+            pattern_files = _list_pattern_files(patterns_dir)
+            patterns_checked = len(pattern_files)
+            loaded = await asyncio.gather(
+                *(asyncio.to_thread(_load_pattern, entry.path) for entry in pattern_files),
+                return_exceptions=True,
+            )
+
+            # Bound once - these run for every pattern
+            findings_append = findings.append
+            historical_matches_append = historical_matches.append
+
+            for pattern_file, pattern in zip(pattern_files, loaded, strict=True):
+                if isinstance(pattern, (json.JSONDecodeError, KeyError, OSError)):
+                    continue
+                if isinstance(pattern, BaseException):
+                    raise pattern
+
+                # Only include unresolved patterns as findings
+                status_val = pattern.get("status", "investigating")
+                if status_val == "resolved":
                     continue
 
+                error_type = pattern.get("error_type")
+                file_path = pattern.get("file_path", "")
+                error_message = pattern.get("error_message", "")
+                suggested_fix = pattern.get("suggested_fix", "")
+
+                severity_index = self._get_severity_from_match(pattern)
+                severity_counts[severity_index] += 1
+
+                finding = Finding(
+                    tool="memory_debugging",
+                    category="debugging",
+                    severity=SEVERITY_ORDER[severity_index],
+                    file_path=file_path,
+                    line_number=pattern.get("line_number"),
+                    code="UNRESOLVED_BUG" if error_type is None else error_type,
+                    message=f"Unresolved bug: {'unknown' if error_type is None else error_type}",
+                    evidence=error_message,
+                    confidence=0.9,
+                    fixable=False,
+                    fix_command=None,
+                    remediation=suggested_fix,
+                )
+                findings_append(finding)
+
+                historical_matches_append(
+                    HistoricalMatch(
+                        pattern_id=pattern_file.name.removesuffix(".json"),
+                        error_type="" if error_type is None else error_type,
+                        similarity_score=0.9,
+                        file_path=file_path,
+                        matched_code=error_message,
+                        historical_fix=suggested_fix,
+                        resolution_time_minutes=0,
+                    ),
+                )
+
         # Calculate score - 100 if no unresolved bugs
-        score = self._calculate_score(findings_by_severity)
+        score = self._calculate_score(severity_counts)
         status = "pass" if score >= 85 else "warn" if score >= 70 else "fail"
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        with FindingSink(self.config.get("output_path")) as sink:
+            sink.extend(findings, "md_")
+
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return ToolResult(
             tool_name="memory_debugging",
             status=status,
             score=score,
-            findings_count=len(findings),
-            findings=findings,
-            findings_by_severity=findings_by_severity,
+            findings_count=sink.count,
+            findings=sink.findings(),
+            findings_by_severity=dict(zip(SEVERITY_ORDER, severity_counts, strict=True)),
             duration_ms=duration_ms,
             metadata={
-                "historical_matches": [dict(m) for m in historical_matches],
+                # HistoricalMatch is a TypedDict and these are built fresh per
+                # run, so the list is handed over without copying each match
+                "historical_matches": historical_matches,
                 "patterns_checked": patterns_checked,
                 "patterns_dir": str(patterns_dir),
                 "mode": "inspection",
+                **sink.metadata(),
             },
             error_message="",
         )
@@ -141,7 +213,7 @@ class DebuggingAdapter:
             ToolResult with systematic debugging findings
 
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             from empathy_software_plugin.wizards.advanced_debugging_wizard import (
@@ -161,53 +233,53 @@ class DebuggingAdapter:
             )
 
             # Convert to unified format
-            findings: list[dict[str, Any]] = []
-            findings_by_severity: dict[str, int] = {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0,
-                "info": 0,
-            }
+            findings: list[Finding] = []
+            severity_counts = [0] * len(SEVERITY_ORDER)
+
+            findings_append = findings.append
+            severity_index_of = self._severity_index
 
             for issue in report.get("issues", []):
-                severity = self._map_severity(issue.get("severity", "medium"))
-                findings_by_severity[severity] += 1
-
-                finding = {
-                    "finding_id": f"ad_{len(findings)}",
-                    "tool": "advanced_debugging",
-                    "category": "debugging",
-                    "severity": severity,
-                    "file_path": issue.get("file_path", ""),
-                    "line_number": issue.get("line_number"),
-                    "code": issue.get("rule_id", "DEBUG"),
-                    "message": issue.get("message", ""),
-                    "evidence": issue.get("code_snippet", ""),
-                    "confidence": issue.get("confidence", 0.8),
-                    "fixable": issue.get("fixable", False),
-                    "fix_command": issue.get("fix_command"),
-                    "remediation": issue.get("recommendation", ""),
-                }
-                findings.append(finding)
+                severity_index = severity_index_of(issue.get("severity", "medium"))
+                severity_counts[severity_index] += 1
+
+                finding = Finding(
+                    tool="advanced_debugging",
+                    category="debugging",
+                    severity=SEVERITY_ORDER[severity_index],
+                    file_path=issue.get("file_path", ""),
+                    line_number=issue.get("line_number"),
+                    code=issue.get("rule_id", "DEBUG"),
+                    message=issue.get("message", ""),
+                    evidence=issue.get("code_snippet", ""),
+                    confidence=issue.get("confidence", 0.8),
+                    fixable=issue.get("fixable", False),
+                    fix_command=issue.get("fix_command"),
+                    remediation=issue.get("recommendation", ""),
+                )
+                findings_append(finding)
 
             # Calculate score
-            score = self._calculate_score(findings_by_severity)
+            score = self._calculate_score(severity_counts)
             status = "pass" if score >= 85 else "warn" if score >= 70 else "fail"
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            with FindingSink(self.config.get("output_path")) as sink:
+                sink.extend(findings, "ad_")
+
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             return ToolResult(
                 tool_name="advanced_debugging",
                 status=status,
                 score=score,
-                findings_count=len(findings),
-                findings=findings,
-                findings_by_severity=findings_by_severity,
+                findings_count=sink.count,
+                findings=sink.findings(),
+                findings_by_severity=dict(zip(SEVERITY_ORDER, severity_counts, strict=True)),
                 duration_ms=duration_ms,
                 metadata={
                     "linters_used": report.get("linters_used", []),
                     "risk_assessments": report.get("risk_assessments", []),
+                    **sink.metadata(),
                 },
                 error_message="",
             )
@@ -215,56 +287,40 @@ class DebuggingAdapter:
         except ImportError:
             return self._create_skip_result(
                 "advanced_debugging_wizard not available",
-                start_time,
+                start_ns,
                 "advanced_debugging",
             )
         except Exception as e:
-            return self._create_error_result(str(e), start_time, "advanced_debugging")
+            return self._create_error_result(str(e), start_ns, "advanced_debugging")
 
-    def _get_severity_from_match(self, match: dict) -> str:
-        """Determine severity based on historical match data."""
+    def _get_severity_from_match(self, match: dict) -> int:
+        """Determine severity index based on historical match data."""
         similarity = match.get("similarity_score", 0.5)
-        error_type = match.get("error_type", "").lower()
 
         # High severity for known critical patterns
-        if any(critical in error_type for critical in ["null", "security", "crash", "injection"]):
-            return "high"
+        if _CRITICAL_ERROR_TYPES.search(match.get("error_type") or ""):
+            return SEVERITY_INDEX["high"]
 
         # Medium for high-similarity matches
         if similarity >= 0.8:
-            return "medium"
-
-        return "low"
-
-    def _map_severity(self, severity: str) -> str:
-        """Map wizard severity to unified severity."""
-        mapping = {
-            "critical": "critical",
-            "high": "high",
-            "medium": "medium",
-            "low": "low",
-            "info": "info",
-            "warning": "medium",
-        }
-        return mapping.get(severity.lower(), "medium")
-
-    def _calculate_score(self, by_severity: dict[str, int]) -> int:
-        """Calculate debugging score."""
-        penalties = {
-            "critical": 20,
-            "high": 12,
-            "medium": 5,
-            "low": 1,
-            "info": 0,
-        }
+            return SEVERITY_INDEX["medium"]
+
+        return SEVERITY_INDEX["low"]
+
+    def _severity_index(self, severity: str) -> int:
+        """Map wizard severity to its unified SEVERITY_ORDER index."""
+        return lookup_severity(_SEVERITY_MAP, severity, SEVERITY_INDEX["medium"])
 
+    def _calculate_score(self, severity_counts: list[int]) -> int:
+        """Calculate debugging score from per-severity counts."""
         total_penalty = sum(
-            count * penalties.get(severity, 0) for severity, count in by_severity.items()
+            count * penalty
+            for count, penalty in zip(severity_counts, SEVERITY_PENALTIES, strict=True)
         )
 
         return max(0, 100 - total_penalty)
 
-    def _create_skip_result(self, reason: str, start_time: float, tool_name: str) -> ToolResult:
+    def _create_skip_result(self, reason: str, start_ns: int, tool_name: str) -> ToolResult:
         """Create a skip result."""
         return ToolResult(
             tool_name=tool_name,
@@ -273,12 +329,12 @@ class DebuggingAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={"skip_reason": reason},
             error_message="",
         )
 
-    def _create_error_result(self, error: str, start_time: float, tool_name: str) -> ToolResult:
+    def _create_error_result(self, error: str, start_ns: int, tool_name: str) -> ToolResult:
         """Create an error result."""
         return ToolResult(
             tool_name=tool_name,
@@ -287,7 +343,7 @@ class DebuggingAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={},
             error_message=error,
         )
@@ -7,15 +7,130 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under Fair Source 0.9
 """
 
+import asyncio
+import functools
 import logging
 import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any
 
 from ..state import ToolResult
+from ._finding import Finding, FindingSink
+from ._paths import iter_py_files, relative_path, root_prefix
+from ._process_pool import get_process_pool
+from ._scan_cache import ScanCache, close_scan_cache, open_scan_cache
+from ._severity import (
+    SEVERITY_INDEX,
+    SEVERITY_ORDER,
+    lookup_severity,
+    with_case_variants,
+)
 
 logger = logging.getLogger(__name__)
 
+# Score penalty per finding, aligned with SEVERITY_ORDER
+SEVERITY_PENALTIES = (25, 15, 5, 1, 0)
+
+# Scanner severity name -> SEVERITY_ORDER index
+_SEVERITY_MAP = with_case_variants({**SEVERITY_INDEX, "informational": SEVERITY_INDEX["info"]})
+
+# Maximum number of file batches scanned concurrently
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Upper bound on files per scan batch when scan_batch_size isn't configured
+MAX_SCAN_BATCH_SIZE = 64
+
+# Dependency manifest audited for CVEs, relative to the project root
+REQUIREMENTS_FILE = "requirements.txt"
+
+# Modules whose source keys the result cache
+_ANALYZER_MODULES = (
+    __name__,
+    "empathy_software_plugin.wizards.security.vulnerability_scanner",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_scanner():
+    """Return the per-process VulnerabilityScanner singleton.
+
+    Also used as the pool initializer, so each worker builds its scanner
+    once at startup rather than on its first file.
+    """
+    from empathy_software_plugin.wizards.security.vulnerability_scanner import (
+        VulnerabilityScanner,
+    )
+
+    return VulnerabilityScanner()
+
+
+def _vuln_record(vuln: Any) -> dict[str, Any]:
+    """Flatten a scanner vulnerability into a plain, cacheable dict.
+
+    Vulnerability dataclasses are mapped to the keys _fold_scan_result
+    reads, with enums replaced by their values; dicts pass through as-is.
+    """
+    if isinstance(vuln, dict):
+        return vuln
+    return {
+        "vulnerability_type": getattr(vuln.vuln_type, "value", vuln.vuln_type),
+        "severity": getattr(vuln.severity, "value", vuln.severity),
+        "line": vuln.line_number,
+        "description": vuln.description,
+        "evidence": vuln.evidence,
+        "remediation": vuln.remediation or "",
+    }
+
+
+def _dep_record(vuln: Any) -> dict[str, Any]:
+    """Flatten a scanner dependency vulnerability into a plain dict.
+
+    DependencyVulnerability dataclasses are mapped to the keys analyze()
+    reads, with the severity enum replaced by its value; dicts pass
+    through as-is.
+    """
+    if isinstance(vuln, dict):
+        return vuln
+    return {
+        "cve_id": vuln.cve_id,
+        "severity": getattr(vuln.severity, "value", vuln.severity),
+        "package": vuln.package_name,
+        "description": vuln.description,
+        "fix_available": vuln.fixed_version is not None,
+        "fix_version": vuln.fixed_version,
+    }
+
+
+def _scan_dependencies(scanner: Any, requirements_file: Path) -> list[dict[str, Any]]:
+    """Scan a requirements file, returning plain dependency records."""
+    return [_dep_record(vuln) for vuln in scanner.scan_dependencies(requirements_file)]
+
+
+def _scan_files(scanner: Any, file_paths: list[str]) -> list[Any]:
+    """Scan a batch of files, returning each file's records or exception.
+
+    A failure on one file is returned in its slot rather than raised, so it
+    doesn't discard the rest of the batch.
+    """
+    results: list[Any] = []
+    for file_path in file_paths:
+        try:
+            vulns = scanner.scan_file(Path(file_path))
+            results.append([_vuln_record(vuln) for vuln in vulns])
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _scan_files_worker(file_paths: list[str]) -> list[Any]:
+    """Scan a batch of files inside a pool worker process.
+
+    Defined at module scope so it can be pickled by ProcessPoolExecutor.
+    """
+    return _scan_files(_worker_scanner(), file_paths)
+
 
 class SecurityAdapter:
     """Adapter for the Security Vulnerability Scanner.
@@ -33,13 +148,18 @@ class SecurityAdapter:
 
         Args:
             project_root: Root directory of the project
-            config: Configuration overrides
+            config: Configuration overrides (e.g. ``max_concurrency``,
+                ``use_process_pool`` to scan files in worker processes,
+                ``use_cache`` / ``cache_dir`` for the content-hash result cache)
             scan_dependencies: Whether to scan dependencies for CVEs
 
         """
         self.project_root = Path(project_root)
+        # Prefix stripped from walked paths to get project-relative paths
+        self._root_prefix = root_prefix(self.project_root)
         self.config = config or {}
         self.scan_dependencies = scan_dependencies
+        self._scanner: Any = None
 
     async def analyze(self) -> ToolResult:
         """Run security scans and return unified result.
@@ -48,110 +168,76 @@ class SecurityAdapter:
             ToolResult with security findings
 
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Import here to handle optional dependency
-            from empathy_software_plugin.wizards.security.vulnerability_scanner import (
-                VulnerabilityScanner,
-            )
+            scanner = self._get_scanner()
 
-            scanner = VulnerabilityScanner()
-
-            # Collect all findings
-            findings: list[dict[str, Any]] = []
-            findings_by_severity: dict[str, int] = {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0,
-                "info": 0,
-            }
-
-            # Scan Python files
-            for py_file in self.project_root.rglob("*.py"):
-                # Skip common exclusions
-                if any(
-                    part in py_file.parts
-                    for part in ["node_modules", ".venv", "__pycache__", ".git"]
-                ):
-                    continue
+            # Counts per severity, indexed like SEVERITY_ORDER
+            severity_counts = [0] * len(SEVERITY_ORDER)
 
-                try:
-                    file_findings = scanner.scan_file(str(py_file))
-                    for vuln in file_findings:
-                        severity = self._map_severity(vuln.get("severity", "medium"))
-                        findings_by_severity[severity] += 1
-
-                        finding = {
-                            "finding_id": f"sec_{len(findings)}",
-                            "tool": "security",
-                            "category": "security",
-                            "severity": severity,
-                            "file_path": str(py_file.relative_to(self.project_root)),
-                            "line_number": vuln.get("line"),
-                            "code": vuln.get("vulnerability_type", "UNKNOWN"),
-                            "message": vuln.get("description", ""),
-                            "evidence": vuln.get("evidence", ""),
-                            "confidence": vuln.get("confidence", 0.8),
-                            "fixable": False,
-                            "fix_command": None,
-                            "remediation": vuln.get("remediation", ""),
-                        }
-                        findings.append(finding)
-                except (OSError, PermissionError) as e:
-                    # File system errors - log and skip
-                    logger.warning(f"Cannot access {py_file}: {e}")
-                    continue
-                except UnicodeDecodeError as e:
-                    # Binary or encoding issues - log and skip
-                    logger.debug(f"Cannot decode {py_file}: {e}")
-                    continue
-                except (ValueError, RuntimeError, KeyError, IndexError, AttributeError) as e:
-                    # Fail secure - treat scan failures as potential issues
-                    logger.error(f"Scanner failed on {py_file}: {e}")
-                    findings_by_severity["medium"] += 1
-                    finding = {
-                        "finding_id": f"sec_{len(findings)}",
-                        "tool": "security",
-                        "category": "security",
-                        "severity": "medium",
-                        "file_path": str(py_file.relative_to(self.project_root)),
-                        "line_number": None,
-                        "code": "SCAN_FAILURE",
-                        "message": f"Security scanner failed: {type(e).__name__}",
-                        "evidence": str(e),
-                        "confidence": 0.5,
-                        "fixable": False,
-                        "fix_command": None,
-                        "remediation": "Manual review recommended - scanner could not complete",
-                    }
-                    findings.append(finding)
-
-            # Scan dependencies if enabled
+            # The dependency scan is independent of the file scan (and often
+            # waits on a network CVE lookup), so start it first and let the
+            # two overlap
+            dep_scan = None
             if self.scan_dependencies:
+                requirements_file = self.project_root / REQUIREMENTS_FILE
+                if requirements_file.is_file():
+                    dep_scan = asyncio.ensure_future(
+                        asyncio.to_thread(_scan_dependencies, scanner, requirements_file),
+                    )
+                else:
+                    logger.info(f"No dependency file found: {requirements_file}")
+
+            py_files = list(iter_py_files(self.project_root))
+            cache = open_scan_cache(self.config, "security", _ANALYZER_MODULES)
+            cache_hits = 0
+
+            # Fold each file's results in as soon as its scan completes, so
+            # per-file result lists are released instead of held until the end
+            file_findings: dict[Path, list[Finding]] = {}
+            try:
+                async with aclosing(
+                    self._iter_scan_results(scanner, py_files, cache),
+                ) as scan_results:
+                    async for py_file, result, from_cache in scan_results:
+                        cache_hits += from_cache
+                        file_findings[py_file] = self._fold_scan_result(
+                            py_file,
+                            result,
+                            severity_counts,
+                        )
+            except BaseException:
+                if dep_scan is not None:
+                    dep_scan.cancel()
+                raise
+            finally:
+                close_scan_cache(cache)
+
+            # Collect dependency scan results
+            dep_findings: list[Finding] = []
+            if dep_scan is not None:
                 try:
-                    dep_vulns = scanner.scan_dependencies(str(self.project_root))
+                    dep_vulns = await dep_scan
                     for vuln in dep_vulns:
-                        severity = self._map_severity(vuln.get("severity", "high"))
-                        findings_by_severity[severity] += 1
-
-                        finding = {
-                            "finding_id": f"sec_dep_{len(findings)}",
-                            "tool": "security",
-                            "category": "deps",
-                            "severity": severity,
-                            "file_path": "requirements.txt",
-                            "line_number": None,
-                            "code": vuln.get("cve_id", "CVE-UNKNOWN"),
-                            "message": f"{vuln.get('package', 'unknown')}: {vuln.get('description', '')}",
-                            "evidence": "",
-                            "confidence": 1.0,
-                            "fixable": vuln.get("fix_available", False),
-                            "fix_command": vuln.get("fix_version"),
-                            "remediation": f"Upgrade to {vuln.get('fix_version', 'latest')}",
-                        }
-                        findings.append(finding)
+                        severity_index = self._severity_index(vuln.get("severity", "high"))
+                        severity_counts[severity_index] += 1
+
+                        finding = Finding(
+                            tool="security",
+                            category="deps",
+                            severity=SEVERITY_ORDER[severity_index],
+                            file_path=REQUIREMENTS_FILE,
+                            line_number=None,
+                            code=vuln.get("cve_id", "CVE-UNKNOWN"),
+                            message=f"{vuln.get('package', 'unknown')}: {vuln.get('description', '')}",
+                            evidence="",
+                            confidence=1.0,
+                            fixable=vuln.get("fix_available", False),
+                            fix_command=vuln.get("fix_version"),
+                            remediation=f"Upgrade to {vuln.get('fix_version', 'latest')}",
+                        )
+                        dep_findings.append(finding)
                 except FileNotFoundError as e:
                     # No requirements file - log info only
                     logger.info(f"No dependency file found: {e}")
@@ -165,44 +251,52 @@ class SecurityAdapter:
                 ) as e:
                     # Fail secure - dependency scan failures are security issues
                     logger.error(f"Dependency scanner failed: {e}")
-                    findings_by_severity["high"] += 1
-                    finding = {
-                        "finding_id": f"sec_dep_{len(findings)}",
-                        "tool": "security",
-                        "category": "deps",
-                        "severity": "high",
-                        "file_path": "requirements.txt",
-                        "line_number": None,
-                        "code": "DEP_SCAN_FAILURE",
-                        "message": f"Dependency scanner failed: {type(e).__name__}",
-                        "evidence": str(e),
-                        "confidence": 0.7,
-                        "fixable": False,
-                        "fix_command": None,
-                        "remediation": "Manual dependency audit recommended - scanner could not complete",
-                    }
-                    findings.append(finding)
+                    severity_counts[SEVERITY_INDEX["high"]] += 1
+                    finding = Finding(
+                        tool="security",
+                        category="deps",
+                        severity="high",
+                        file_path=REQUIREMENTS_FILE,
+                        line_number=None,
+                        code="DEP_SCAN_FAILURE",
+                        message=f"Dependency scanner failed: {type(e).__name__}",
+                        evidence=str(e),
+                        confidence=0.7,
+                        fixable=False,
+                        fix_command=None,
+                        remediation="Manual dependency audit recommended - scanner could not complete",
+                    )
+                    dep_findings.append(finding)
                 except OSError as e:
                     # File system errors - log and continue
                     logger.warning(f"Cannot access dependency files: {e}")
 
+            # Scans complete in any order; report findings in walk order,
+            # then dependency findings
+            with FindingSink(self.config.get("output_path")) as sink:
+                for py_file in py_files:
+                    sink.extend(file_findings.pop(py_file, ()), "sec_")
+                sink.extend(dep_findings, "sec_dep_")
+
             # Calculate score
-            score = self._calculate_score(findings_by_severity)
+            score = self._calculate_score(severity_counts)
             status = "pass" if score >= 85 else "warn" if score >= 70 else "fail"
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             return ToolResult(
                 tool_name="security",
                 status=status,
                 score=score,
-                findings_count=len(findings),
-                findings=findings,
-                findings_by_severity=findings_by_severity,
+                findings_count=sink.count,
+                findings=sink.findings(),
+                findings_by_severity=dict(zip(SEVERITY_ORDER, severity_counts, strict=True)),
                 duration_ms=duration_ms,
                 metadata={
-                    "files_scanned": sum(1 for _ in self.project_root.rglob("*.py")),
+                    "files_scanned": len(py_files),
+                    "cache_hits": cache_hits,
                     "dependencies_scanned": self.scan_dependencies,
+                    **sink.metadata(),
                 },
                 error_message="",
             )
@@ -210,53 +304,212 @@ class SecurityAdapter:
         except ImportError:
             return self._create_skip_result(
                 "vulnerability_scanner module not available",
-                start_time,
+                start_ns,
             )
         except OSError as e:
             # File system errors accessing project root
             logger.critical(f"File system error during security scan: {e}")
-            return self._create_error_result(f"Cannot access project files: {e}", start_time)
+            return self._create_error_result(f"Cannot access project files: {e}", start_ns)
         except (AttributeError, TypeError) as e:
             # Scanner API errors or invalid configuration
             logger.error(f"Security scanner configuration error: {e}")
-            return self._create_error_result(f"Scanner configuration issue: {e}", start_time)
+            return self._create_error_result(f"Scanner configuration issue: {e}", start_ns)
         except Exception as e:
             # Unexpected errors - log and report
             logger.exception(f"Unexpected error in security scan: {e}")
             return self._create_error_result(
-                f"Security scan failed: {type(e).__name__}: {e}", start_time
+                f"Security scan failed: {type(e).__name__}: {e}", start_ns
             )
 
-    def _map_severity(self, severity: str) -> str:
-        """Map scanner severity to unified severity."""
-        mapping = {
-            "critical": "critical",
-            "high": "high",
-            "medium": "medium",
-            "low": "low",
-            "info": "info",
-            "informational": "info",
-        }
-        return mapping.get(severity.lower(), "medium")
-
-    def _calculate_score(self, by_severity: dict[str, int]) -> int:
-        """Calculate security score based on findings."""
-        # Penalties for each severity
-        penalties = {
-            "critical": 25,
-            "high": 15,
-            "medium": 5,
-            "low": 1,
-            "info": 0,
-        }
+    def _get_scanner(self) -> Any:
+        """Return the VulnerabilityScanner, creating it on first use.
+
+        The scanner compiles its pattern tables on construction, so one
+        instance is reused across analyze() runs of this adapter.
+        """
+        if self._scanner is None:
+            # Import here to handle optional dependency
+            from empathy_software_plugin.wizards.security.vulnerability_scanner import (
+                VulnerabilityScanner,
+            )
+
+            self._scanner = VulnerabilityScanner()
+        return self._scanner
+
+    async def _iter_scan_results(
+        self,
+        scanner: Any,
+        py_files: list[Path],
+        cache: ScanCache | None,
+    ) -> AsyncIterator[tuple[Path, Any, bool]]:
+        """Scan files concurrently, yielding results as each batch completes.
+
+        scan_file is synchronous, so files are scanned in batches, each in a
+        worker thread (or a worker process when use_process_pool is set, to
+        escape the GIL), capped by a semaphore. Batching means one thread or
+        pool round trip per batch instead of per file; the default batch
+        size keeps several batches per concurrency slot so work stays
+        balanced, and is 1 for small projects.
+
+        Yields:
+            (file, result, from_cache) where result is the scanner's finding
+            list or the exception it raised
+
+        """
+        max_concurrency = self.config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        batch_size = self.config.get(
+            "scan_batch_size",
+            min(MAX_SCAN_BATCH_SIZE, max(1, len(py_files) // (max_concurrency * 4))),
+        )
+        use_process_pool = self.config.get("use_process_pool", False)
+        loop = asyncio.get_running_loop()
+
+        async def _scan_batch(batch: list[Path]) -> list[tuple[Path, Any, bool]]:
+            results: list[tuple[Path, Any, bool]] = []
+            to_scan: list[tuple[Path, str | None]] = []
+            async with semaphore:
+                for py_file in batch:
+                    digest = None
+                    if cache is not None:
+                        try:
+                            data = await asyncio.to_thread(py_file.read_bytes)
+                        except Exception as e:
+                            results.append((py_file, e, False))
+                            continue
+                        digest = ScanCache.digest(data)
+                        cached = cache.get(digest)
+                        if cached is not None:
+                            results.append((py_file, cached, True))
+                            continue
+                    to_scan.append((py_file, digest))
+
+                if not to_scan:
+                    return results
+
+                file_paths = [str(py_file) for py_file, _ in to_scan]
+                try:
+                    if use_process_pool:
+                        scanned = await loop.run_in_executor(
+                            get_process_pool("security", _worker_scanner),
+                            _scan_files_worker,
+                            file_paths,
+                        )
+                    else:
+                        scanned = await asyncio.to_thread(_scan_files, scanner, file_paths)
+                except Exception as e:
+                    # The batch as a whole failed (e.g. a broken pool)
+                    scanned = [e] * len(to_scan)
+
+            for (py_file, digest), file_findings in zip(to_scan, scanned, strict=True):
+                if (
+                    cache is not None
+                    and digest is not None
+                    and not isinstance(file_findings, Exception)
+                ):
+                    cache.set(digest, file_findings)
+                results.append((py_file, file_findings, False))
+            return results
+
+        tasks = [
+            asyncio.ensure_future(_scan_batch(py_files[start : start + batch_size]))
+            for start in range(0, len(py_files), batch_size)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for scan_result in await next_done:
+                    yield scan_result
+        finally:
+            # Stop outstanding scans if the consumer bails out early
+            for task in tasks:
+                task.cancel()
+
+    def _fold_scan_result(
+        self,
+        py_file: Path,
+        result: Any,
+        severity_counts: list[int],
+    ) -> list[Finding]:
+        """Fold one file's scan result into the severity counts.
+
+        Returns:
+            The file's findings, without IDs
+
+        """
+        if isinstance(result, OSError):
+            # File system errors - log and skip
+            logger.warning(f"Cannot access {py_file}: {result}")
+            return []
+        if isinstance(result, UnicodeDecodeError):
+            # Binary or encoding issues - log and skip
+            logger.debug(f"Cannot decode {py_file}: {result}")
+            return []
+
+        file_path = relative_path(py_file, self.project_root, self._root_prefix)
+        if isinstance(result, (ValueError, RuntimeError, KeyError, IndexError, AttributeError)):
+            # Fail secure - treat scan failures as potential issues
+            logger.error(f"Scanner failed on {py_file}: {result}")
+            severity_counts[SEVERITY_INDEX["medium"]] += 1
+            finding = Finding(
+                tool="security",
+                category="security",
+                severity="medium",
+                file_path=file_path,
+                line_number=None,
+                code="SCAN_FAILURE",
+                message=f"Security scanner failed: {type(result).__name__}",
+                evidence=str(result),
+                confidence=0.5,
+                fixable=False,
+                fix_command=None,
+                remediation="Manual review recommended - scanner could not complete",
+            )
+            return [finding]
+        if isinstance(result, BaseException):
+            # Anything else is handled by analyze()'s exception handlers
+            raise result
+
+        findings: list[Finding] = []
+        # Bound once - these run for every finding
+        findings_append = findings.append
+        severity_index_of = self._severity_index
+
+        for vuln in result:
+            severity_index = severity_index_of(vuln.get("severity", "medium"))
+            severity_counts[severity_index] += 1
+
+            finding = Finding(
+                tool="security",
+                category="security",
+                severity=SEVERITY_ORDER[severity_index],
+                file_path=file_path,
+                line_number=vuln.get("line"),
+                code=vuln.get("vulnerability_type", "UNKNOWN"),
+                message=vuln.get("description", ""),
+                evidence=vuln.get("evidence", ""),
+                confidence=vuln.get("confidence", 0.8),
+                fixable=False,
+                fix_command=None,
+                remediation=vuln.get("remediation", ""),
+            )
+            findings_append(finding)
+
+        return findings
+
+    def _severity_index(self, severity: str) -> int:
+        """Map scanner severity to its unified SEVERITY_ORDER index."""
+        return lookup_severity(_SEVERITY_MAP, severity, SEVERITY_INDEX["medium"])
 
+    def _calculate_score(self, severity_counts: list[int]) -> int:
+        """Calculate security score from per-severity counts."""
         total_penalty = sum(
-            count * penalties.get(severity, 0) for severity, count in by_severity.items()
+            count * penalty
+            for count, penalty in zip(severity_counts, SEVERITY_PENALTIES, strict=True)
         )
 
         return max(0, 100 - total_penalty)
 
-    def _create_skip_result(self, reason: str, start_time: float) -> ToolResult:
+    def _create_skip_result(self, reason: str, start_ns: int) -> ToolResult:
         """Create a skip result."""
         return ToolResult(
             tool_name="security",
@@ -265,12 +518,12 @@ class SecurityAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={"skip_reason": reason},
             error_message="",
         )
 
-    def _create_error_result(self, error: str, start_time: float) -> ToolResult:
+    def _create_error_result(self, error: str, start_ns: int) -> ToolResult:
         """Create an error result."""
         return ToolResult(
             tool_name="security",
@@ -279,7 +532,7 @@ class SecurityAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={},
             error_message=error,
         )
@@ -7,15 +7,135 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under Fair Source 0.9
 """
 
+import asyncio
 import logging
+import re
+import threading
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from ..state import ToolResult
+from ._finding import Finding, FindingSink
+from ._paths import iter_py_files, relative_path, root_prefix
+from ._scan_cache import ScanCache, close_scan_cache, open_scan_cache
+from ._severity import (
+    SEVERITY_INDEX,
+    SEVERITY_ORDER,
+    lookup_severity,
+    with_case_variants,
+)
 
 logger = logging.getLogger(__name__)
 
+# Use Hyperscan to skip files without debt markers when available
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Score penalty per finding, aligned with SEVERITY_ORDER
+SEVERITY_PENALTIES = (15, 8, 3, 0.5, 0)
+
+# Wizard severity name -> SEVERITY_ORDER index
+_SEVERITY_MAP = with_case_variants(SEVERITY_INDEX)
+
+# Debt marker -> SEVERITY_ORDER index
+_DEBT_TYPE_SEVERITY = {
+    "FIXME": SEVERITY_INDEX["high"],
+    "HACK": SEVERITY_INDEX["high"],
+    "XXX": SEVERITY_INDEX["medium"],
+    "TODO": SEVERITY_INDEX["low"],
+}
+
+# Maximum number of files scanned concurrently by the fallback analysis
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Modules whose source keys the result cache; the marker regex lives here
+_ANALYZER_MODULES = (__name__,)
+
+# Debt marker comments (TODO, FIXME, HACK, XXX) in a single alternation.
+# Whitespace is restricted to the marker's own line, so a match never
+# spills into the next one, and the message stops at the next marker so
+# several markers on one line are each reported. Matched against raw bytes
+# so only marker lines are ever decoded
+_DEBT_MARKER_PATTERN = re.compile(
+    rb"#[^\S\n]*(TODO|FIXME|HACK|XXX)(?::|[^\S\n])"
+    rb"((?:(?!#[^\S\n]*(?:TODO|FIXME|HACK|XXX)).)*)",
+    re.IGNORECASE,
+)
+
+# Looser form of _DEBT_MARKER_PATTERN for the Hyperscan prefilter; any file
+# the regex would match also matches this
+_DEBT_MARKER_PREFILTER = rb"#\s*(?:TODO|FIXME|HACK|XXX)"
+
+# Hyperscan scratch space can't be shared between threads, so each scan
+# thread compiles its own prefilter database
+_prefilter_local = threading.local()
+
+
+def _may_have_debt_markers(data: bytes) -> bool:
+    """Check whether a file can contain debt markers.
+
+    Returns True without scanning when Hyperscan is not installed.
+    """
+    if hyperscan is None:
+        return True
+
+    database = getattr(_prefilter_local, "database", None)
+    if database is None:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[_DEBT_MARKER_PREFILTER],
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH],
+        )
+        _prefilter_local.database = database
+
+    matched = False
+
+    def _on_match(*_args: Any) -> None:
+        nonlocal matched
+        matched = True
+
+    database.scan(data, match_event_handler=_on_match)
+    return matched
+
+
+def _scan_debt_markers(data: bytes) -> list[list[Any]]:
+    """Find debt markers in one file's source.
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        [line_number, debt_type, message, evidence] per marker, in file order
+
+    Raises:
+        UnicodeDecodeError: If a marker line is not valid UTF-8
+
+    """
+    markers: list[list[Any]] = []
+    if not _may_have_debt_markers(data):
+        return markers
+
+    # One pass over the whole file; line numbers are tracked by counting
+    # newlines between consecutive matches
+    line_num = 1
+    counted_to = 0
+    for match in _DEBT_MARKER_PATTERN.finditer(data):
+        line_start = data.rfind(b"\n", 0, match.start()) + 1
+        line_num += data.count(b"\n", counted_to, line_start)
+        counted_to = line_start
+
+        debt_type = match.group(1).decode("ascii").upper()
+        message = match.group(2).decode("utf-8").strip() if match.group(2) else debt_type
+        line_end = data.find(b"\n", match.end())
+        evidence = data[line_start : line_end if line_end >= 0 else None].decode("utf-8").strip()
+        markers.append([line_num, debt_type, message, evidence])
+
+    return markers
+
 
 class TechDebtAdapter:
     """Adapter for the Tech Debt Wizard.
@@ -36,6 +156,7 @@ class TechDebtAdapter:
 
         """
         self.project_root = Path(project_root)
+        self._root_prefix = root_prefix(self.project_root)
         self.config = config or {}
 
     async def analyze(self) -> ToolResult:
@@ -45,7 +166,7 @@ class TechDebtAdapter:
             ToolResult with tech debt findings
 
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Import here to handle optional dependency
@@ -61,54 +182,37 @@ class TechDebtAdapter:
                 },
             )
 
+            # Counts per severity, indexed like SEVERITY_ORDER
+            severity_counts = [0] * len(SEVERITY_ORDER)
+
             # Convert findings to unified format
-            findings: list[dict[str, Any]] = []
-            findings_by_severity: dict[str, int] = {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0,
-                "info": 0,
-            }
-
-            for item in report.get("debt_items", []):
-                severity = self._map_severity(item.get("severity", "medium"))
-                findings_by_severity[severity] += 1
-
-                finding = {
-                    "finding_id": f"td_{len(findings)}",
-                    "tool": "tech_debt",
-                    "category": "debt",
-                    "severity": severity,
-                    "file_path": item.get("file_path", ""),
-                    "line_number": item.get("line_number"),
-                    "code": item.get("debt_type", "TODO"),
-                    "message": item.get("content", ""),
-                    "evidence": item.get("context", ""),
-                    "confidence": 1.0,
-                    "fixable": False,
-                    "fix_command": None,
-                }
-                findings.append(finding)
+            with FindingSink(self.config.get("output_path")) as sink:
+                sink.extend(
+                    self._iter_debt_items(report.get("debt_items", []), severity_counts),
+                    "td_",
+                )
+
+            findings_by_severity = dict(zip(SEVERITY_ORDER, severity_counts, strict=True))
 
             # Calculate score
             score = report.get("health_score", self._calculate_score(findings_by_severity))
             status = "pass" if score >= 85 else "warn" if score >= 70 else "fail"
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             return ToolResult(
                 tool_name="tech_debt",
                 status=status,
                 score=score,
-                findings_count=len(findings),
-                findings=findings,
+                findings_count=sink.count,
+                findings=sink.findings(),
                 findings_by_severity=findings_by_severity,
                 duration_ms=duration_ms,
                 metadata={
                     "trajectory": report.get("trajectory", {}),
                     "hotspots": report.get("hotspots", []),
                     "by_type": report.get("by_type", {}),
+                    **sink.metadata(),
                 },
                 error_message="",
             )
@@ -116,137 +220,177 @@ class TechDebtAdapter:
         except ImportError:
             # Fallback: Simple pattern scanning
             logger.info("Tech debt wizard not available, using fallback analysis")
-            return await self._fallback_analyze(start_time)
+            return await self._fallback_analyze(start_ns)
         except (KeyError, ValueError, TypeError) as e:
             # Data format or configuration errors
             logger.error(f"Tech debt analysis data error: {e}")
-            return self._create_error_result(f"Data validation error: {e}", start_time)
+            return self._create_error_result(f"Data validation error: {e}", start_ns)
         except OSError as e:
             # File system errors
             logger.error(f"Tech debt analysis file system error: {e}")
-            return self._create_error_result(f"Cannot access project files: {e}", start_time)
+            return self._create_error_result(f"Cannot access project files: {e}", start_ns)
         except Exception as e:
             # Unexpected errors - log with full context
             logger.exception(f"Unexpected error in tech debt analysis: {e}")
             return self._create_error_result(
-                f"Tech debt analysis failed: {type(e).__name__}: {e}", start_time
+                f"Tech debt analysis failed: {type(e).__name__}: {e}", start_ns
             )
 
-    async def _fallback_analyze(self, start_time: float) -> ToolResult:
+    async def _fallback_analyze(self, start_ns: int) -> ToolResult:
         """Simple fallback analysis when wizard not available."""
-        import re
-
-        patterns = {
-            "TODO": re.compile(r"#\s*TODO[:\s](.*)$", re.IGNORECASE | re.MULTILINE),
-            "FIXME": re.compile(r"#\s*FIXME[:\s](.*)$", re.IGNORECASE | re.MULTILINE),
-            "HACK": re.compile(r"#\s*HACK[:\s](.*)$", re.IGNORECASE | re.MULTILINE),
-            "XXX": re.compile(r"#\s*XXX[:\s](.*)$", re.IGNORECASE | re.MULTILINE),
-        }
-
-        findings: list[dict[str, Any]] = []
-        findings_by_severity: dict[str, int] = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "info": 0,
-        }
-
-        for py_file in self.project_root.rglob("*.py"):
-            if any(
-                part in py_file.parts for part in ["node_modules", ".venv", "__pycache__", ".git"]
-            ):
-                continue
-
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                lines = content.split("\n")
-
-                for line_num, line in enumerate(lines, 1):
-                    for debt_type, pattern in patterns.items():
-                        match = pattern.search(line)
-                        if match:
-                            severity = self._get_debt_severity(debt_type)
-                            findings_by_severity[severity] += 1
-
-                            finding = {
-                                "finding_id": f"td_{len(findings)}",
-                                "tool": "tech_debt",
-                                "category": "debt",
-                                "severity": severity,
-                                "file_path": str(py_file.relative_to(self.project_root)),
-                                "line_number": line_num,
-                                "code": debt_type,
-                                "message": match.group(1).strip() if match.group(1) else debt_type,
-                                "evidence": line.strip(),
-                                "confidence": 1.0,
-                                "fixable": False,
-                                "fix_command": None,
-                            }
-                            findings.append(finding)
-            except (OSError, PermissionError) as e:
-                # File system errors - log and skip
-                logger.warning(f"Cannot access {py_file}: {e}")
-                continue
-            except UnicodeDecodeError as e:
-                # Binary or encoding issues - log and skip
-                logger.debug(f"Cannot decode {py_file}: {e}")
-                continue
+        # Counts per severity, indexed like SEVERITY_ORDER
+        severity_counts = [0] * len(SEVERITY_ORDER)
+
+        py_files = list(iter_py_files(self.project_root))
+        cache = open_scan_cache(self.config, "tech_debt", _ANALYZER_MODULES)
+        cache_hits = 0
+
+        # Reads and marker scans run in worker threads, capped by a semaphore
+        # so large trees don't exhaust file descriptors; gather keeps results
+        # in file order
+        semaphore = asyncio.Semaphore(
+            self.config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+        )
+
+        async def _scan_one(py_file: Path) -> list[list[Any]]:
+            nonlocal cache_hits
+            async with semaphore:
+                data = await asyncio.to_thread(py_file.read_bytes)
+                if cache is None:
+                    return await asyncio.to_thread(_scan_debt_markers, data)
+
+                digest = ScanCache.digest(data)
+                markers = cache.get(digest)
+                if markers is not None:
+                    cache_hits += 1
+                    return markers
 
+                markers = await asyncio.to_thread(_scan_debt_markers, data)
+                cache.set(digest, markers)
+                return markers
+
+        try:
+            results = await asyncio.gather(
+                *(_scan_one(py_file) for py_file in py_files),
+                return_exceptions=True,
+            )
+        finally:
+            close_scan_cache(cache)
+
+        with FindingSink(self.config.get("output_path")) as sink:
+            for py_file, markers in zip(py_files, results, strict=True):
+                sink.extend(self._fold_markers(py_file, markers, severity_counts), "td_")
+
+        findings_by_severity = dict(zip(SEVERITY_ORDER, severity_counts, strict=True))
         score = self._calculate_score(findings_by_severity)
         status = "pass" if score >= 85 else "warn" if score >= 70 else "fail"
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return ToolResult(
             tool_name="tech_debt",
             status=status,
             score=score,
-            findings_count=len(findings),
-            findings=findings,
+            findings_count=sink.count,
+            findings=sink.findings(),
             findings_by_severity=findings_by_severity,
             duration_ms=duration_ms,
-            metadata={"mode": "fallback"},
+            metadata={"mode": "fallback", "cache_hits": cache_hits, **sink.metadata()},
             error_message="",
         )
 
+    def _iter_debt_items(
+        self,
+        debt_items: list[dict[str, Any]],
+        severity_counts: list[int],
+    ) -> Iterator[Finding]:
+        """Convert the wizard's debt items to findings, counting severities."""
+        for item in debt_items:
+            severity_index = self._severity_index(item.get("severity", "medium"))
+            severity_counts[severity_index] += 1
+
+            yield Finding(
+                tool="tech_debt",
+                category="debt",
+                severity=SEVERITY_ORDER[severity_index],
+                file_path=item.get("file_path", ""),
+                line_number=item.get("line_number"),
+                code=item.get("debt_type", "TODO"),
+                message=item.get("content", ""),
+                evidence=item.get("context", ""),
+                confidence=1.0,
+                fixable=False,
+                fix_command=None,
+            )
+
+    def _fold_markers(
+        self,
+        py_file: Path,
+        markers: Any,
+        severity_counts: list[int],
+    ) -> list[Finding]:
+        """Fold one file's debt markers into the severity counts.
+
+        Returns:
+            The file's findings, without IDs
+
+        """
+        if isinstance(markers, OSError):
+            # File system errors - log and skip
+            logger.warning(f"Cannot access {py_file}: {markers}")
+            return []
+        if isinstance(markers, UnicodeDecodeError):
+            # Binary or encoding issues - log and skip
+            logger.debug(f"Cannot decode {py_file}: {markers}")
+            return []
+        if isinstance(markers, BaseException):
+            raise markers
+
+        # Cached markers are position-only; ids and paths are stamped here
+        file_path = relative_path(py_file, self.project_root, self._root_prefix)
+        file_findings: list[Finding] = []
+        for line_num, debt_type, message, evidence in markers:
+            severity_index = _DEBT_TYPE_SEVERITY.get(debt_type, SEVERITY_INDEX["low"])
+            severity_counts[severity_index] += 1
+
+            finding = Finding(
+                tool="tech_debt",
+                category="debt",
+                severity=SEVERITY_ORDER[severity_index],
+                file_path=file_path,
+                line_number=line_num,
+                code=debt_type,
+                message=message,
+                evidence=evidence,
+                confidence=1.0,
+                fixable=False,
+                fix_command=None,
+            )
+            file_findings.append(finding)
+
+        return file_findings
+
+    def _severity_index(self, severity: str) -> int:
+        """Map debt severity to its unified SEVERITY_ORDER index."""
+        return lookup_severity(_SEVERITY_MAP, severity, SEVERITY_INDEX["medium"])
+
     def _map_severity(self, severity: str) -> str:
         """Map debt severity to unified severity."""
-        mapping = {
-            "critical": "critical",
-            "high": "high",
-            "medium": "medium",
-            "low": "low",
-            "info": "info",
-        }
-        return mapping.get(severity.lower(), "medium")
+        return SEVERITY_ORDER[self._severity_index(severity)]
 
     def _get_debt_severity(self, debt_type: str) -> str:
         """Get severity based on debt type."""
-        mapping = {
-            "FIXME": "high",
-            "HACK": "high",
-            "XXX": "medium",
-            "TODO": "low",
-        }
-        return mapping.get(debt_type, "low")
+        return SEVERITY_ORDER[_DEBT_TYPE_SEVERITY.get(debt_type, SEVERITY_INDEX["low"])]
 
     def _calculate_score(self, by_severity: dict[str, int]) -> int:
         """Calculate tech debt score."""
-        penalties = {
-            "critical": 15,
-            "high": 8,
-            "medium": 3,
-            "low": 0.5,
-            "info": 0,
-        }
-
         total_penalty = sum(
-            count * penalties.get(severity, 0) for severity, count in by_severity.items()
+            by_severity.get(severity, 0) * penalty
+            for severity, penalty in zip(SEVERITY_ORDER, SEVERITY_PENALTIES, strict=True)
         )
 
         return max(0, int(100 - total_penalty))
 
-    def _create_error_result(self, error: str, start_time: float) -> ToolResult:
+    def _create_error_result(self, error: str, start_ns: int) -> ToolResult:
         """Create an error result."""
         return ToolResult(
             tool_name="tech_debt",
@@ -255,7 +399,7 @@ class TechDebtAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={},
             error_message=error,
         )
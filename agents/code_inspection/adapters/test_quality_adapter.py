@@ -7,11 +7,73 @@ Copyright 2025 Smart AI Memory, LLC
 Licensed under Fair Source 0.9
 """
 
+import asyncio
+import functools
 import time
 from pathlib import Path
 from typing import Any
 
 from ..state import ToolResult
+from ._finding import Finding, FindingSink
+from ._paths import iter_py_files, relative_path, root_prefix
+from ._process_pool import get_process_pool
+from ._scan_cache import ScanCache, close_scan_cache, open_scan_cache
+from ._severity import (
+    SEVERITY_INDEX,
+    SEVERITY_ORDER,
+    lookup_severity,
+    with_case_variants,
+)
+
+# Score penalty per issue, aligned with SEVERITY_ORDER
+SEVERITY_PENALTIES = (20, 10, 3, 1, 0)
+
+# Analyzer severity name -> SEVERITY_ORDER index
+_SEVERITY_MAP = with_case_variants({**SEVERITY_INDEX, "warning": SEVERITY_INDEX["medium"]})
+
+# Maximum number of test files analyzed concurrently
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Modules whose source keys the result cache
+_ANALYZER_MODULES = (
+    __name__,
+    "empathy_software_plugin.wizards.testing.quality_analyzer",
+)
+
+
+def _issue_record(issue: Any) -> dict[str, Any]:
+    """Flatten an analyzer issue into a plain, cacheable dict."""
+    return {
+        "severity": issue.severity,
+        "line_number": issue.line_number,
+        "issue_type": issue.issue_type,
+        "description": issue.description,
+        "code_snippet": issue.code_snippet,
+        "confidence": issue.confidence,
+        "suggestion": issue.suggestion,
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_analyzer():
+    """Return the per-process TestQualityAnalyzer singleton.
+
+    Also used as the pool initializer, so each worker builds its analyzer
+    once at startup rather than on its first file.
+    """
+    from empathy_software_plugin.wizards.testing.quality_analyzer import TestQualityAnalyzer
+
+    return TestQualityAnalyzer()
+
+
+def _analyze_file_worker(file_path: str) -> list[dict[str, Any]]:
+    """Analyze a single test file inside a pool worker process.
+
+    Defined at module scope so it can be pickled by ProcessPoolExecutor;
+    returns plain issue records, which pickle cheaply.
+    """
+    report = _worker_analyzer().analyze_test_file(file_path)
+    return [_issue_record(issue) for issue in report.issues]
 
 
 class TestQualityAdapter:
@@ -35,6 +97,7 @@ class TestQualityAdapter:
 
         """
         self.project_root = Path(project_root)
+        self._root_prefix = root_prefix(self.project_root)
         self.config = config or {}
         self.test_dirs = test_dirs or ["tests", "test"]
 
@@ -45,7 +108,7 @@ class TestQualityAdapter:
             ToolResult with test quality findings
 
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Import here to handle optional dependency
@@ -53,111 +116,160 @@ class TestQualityAdapter:
 
             analyzer = TestQualityAnalyzer()
 
-            # Collect all findings
-            findings: list[dict[str, Any]] = []
-            findings_by_severity: dict[str, int] = {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0,
-                "info": 0,
-            }
-            files_analyzed = 0
+            # Counts per severity, indexed like SEVERITY_ORDER
+            severity_counts = [0] * len(SEVERITY_ORDER)
 
             # Find test files
-            for test_dir in self.test_dirs:
-                test_path = self.project_root / test_dir
-                if not test_path.exists():
-                    continue
-
-                for test_file in test_path.rglob("test_*.py"):
-                    files_analyzed += 1
-                    try:
-                        report = analyzer.analyze_test_file(str(test_file))
-
-                        for issue in report.issues:
-                            severity = self._map_severity(issue.severity)
-                            findings_by_severity[severity] += 1
-
-                            finding = {
-                                "finding_id": f"tq_{len(findings)}",
-                                "tool": "test_quality",
-                                "category": "tests",
-                                "severity": severity,
-                                "file_path": str(test_file.relative_to(self.project_root)),
-                                "line_number": issue.line_number,
-                                "code": issue.issue_type,
-                                "message": issue.description,
-                                "evidence": issue.code_snippet or "",
-                                "confidence": issue.confidence,
-                                "fixable": False,
-                                "fix_command": None,
-                                "remediation": issue.suggestion or "",
-                            }
-                            findings.append(finding)
-                    except Exception:
-                        # Skip files that can't be analyzed
-                        continue
+            test_files = [
+                test_file
+                for test_dir in self.test_dirs
+                if (test_path := self.project_root / test_dir).exists()
+                for test_file in iter_py_files(test_path)
+                if test_file.name.startswith("test_")
+            ]
+            files_analyzed = len(test_files)
+
+            cache = open_scan_cache(self.config, "test_quality", _ANALYZER_MODULES)
+            cache_hits = 0
+
+            # analyze_test_file is synchronous, so run files in worker threads,
+            # capped by a semaphore; gather keeps results in file order
+            semaphore = asyncio.Semaphore(
+                self.config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+            )
+
+            # Optionally analyze in worker processes, to escape the GIL
+            use_process_pool = self.config.get("use_process_pool", False)
+            loop = asyncio.get_running_loop()
+
+            async def _analyze_one(test_file: Path) -> list[dict[str, Any]]:
+                nonlocal cache_hits
+                async with semaphore:
+                    if cache is not None:
+                        data = await asyncio.to_thread(test_file.read_bytes)
+                        digest = ScanCache.digest(data)
+                        issues = cache.get(digest)
+                        if issues is not None:
+                            cache_hits += 1
+                            return issues
+
+                    if use_process_pool:
+                        issues = await loop.run_in_executor(
+                            get_process_pool("test_quality", _worker_analyzer),
+                            _analyze_file_worker,
+                            str(test_file),
+                        )
+                    else:
+                        report = await asyncio.to_thread(
+                            analyzer.analyze_test_file,
+                            str(test_file),
+                        )
+                        issues = [_issue_record(issue) for issue in report.issues]
+                    if cache is not None:
+                        cache.set(digest, issues)
+                    return issues
+
+            try:
+                results = await asyncio.gather(
+                    *(_analyze_one(test_file) for test_file in test_files),
+                    return_exceptions=True,
+                )
+            finally:
+                close_scan_cache(cache)
+
+            # Collect all findings
+            with FindingSink(self.config.get("output_path")) as sink:
+                for test_file, issues in zip(test_files, results, strict=True):
+                    sink.extend(self._fold_issues(test_file, issues, severity_counts), "tq_")
 
             # Calculate score
-            score = self._calculate_score(findings_by_severity, files_analyzed)
+            score = self._calculate_score(severity_counts, files_analyzed)
             status = "pass" if score >= 85 else "warn" if score >= 70 else "fail"
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             return ToolResult(
                 tool_name="test_quality",
                 status=status,
                 score=score,
-                findings_count=len(findings),
-                findings=findings,
-                findings_by_severity=findings_by_severity,
+                findings_count=sink.count,
+                findings=sink.findings(),
+                findings_by_severity=dict(zip(SEVERITY_ORDER, severity_counts, strict=True)),
                 duration_ms=duration_ms,
                 metadata={
                     "files_analyzed": files_analyzed,
+                    "cache_hits": cache_hits,
                     "test_dirs_searched": self.test_dirs,
+                    **sink.metadata(),
                 },
                 error_message="",
             )
 
         except ImportError:
-            return self._create_skip_result("quality_analyzer module not available", start_time)
+            return self._create_skip_result("quality_analyzer module not available", start_ns)
         except Exception as e:
-            return self._create_error_result(str(e), start_time)
-
-    def _map_severity(self, severity: str) -> str:
-        """Map analyzer severity to unified severity."""
-        mapping = {
-            "critical": "critical",
-            "high": "high",
-            "medium": "medium",
-            "low": "low",
-            "info": "info",
-            "warning": "medium",
-        }
-        return mapping.get(severity.lower(), "medium")
-
-    def _calculate_score(self, by_severity: dict[str, int], files_analyzed: int) -> int:
-        """Calculate test quality score."""
+            return self._create_error_result(str(e), start_ns)
+
+    def _fold_issues(
+        self,
+        test_file: Path,
+        issues: Any,
+        severity_counts: list[int],
+    ) -> list[Finding]:
+        """Fold one test file's issues into the severity counts.
+
+        Returns:
+            The file's findings, without IDs
+
+        """
+        if isinstance(issues, Exception):
+            # Skip files that can't be analyzed
+            return []
+        if isinstance(issues, BaseException):
+            raise issues
+
+        # Cached issues are position-only; ids and paths are stamped here
+        file_path = relative_path(test_file, self.project_root, self._root_prefix)
+        file_findings: list[Finding] = []
+        for issue in issues:
+            severity_index = self._severity_index(issue["severity"])
+            severity_counts[severity_index] += 1
+
+            finding = Finding(
+                tool="test_quality",
+                category="tests",
+                severity=SEVERITY_ORDER[severity_index],
+                file_path=file_path,
+                line_number=issue["line_number"],
+                code=issue["issue_type"],
+                message=issue["description"],
+                evidence=issue["code_snippet"] or "",
+                confidence=issue["confidence"],
+                fixable=False,
+                fix_command=None,
+                remediation=issue["suggestion"] or "",
+            )
+            file_findings.append(finding)
+
+        return file_findings
+
+    def _severity_index(self, severity: str) -> int:
+        """Map analyzer severity to its unified SEVERITY_ORDER index."""
+        return lookup_severity(_SEVERITY_MAP, severity, SEVERITY_INDEX["medium"])
+
+    def _calculate_score(self, severity_counts: list[int], files_analyzed: int) -> int:
+        """Calculate test quality score from per-severity counts."""
         if files_analyzed == 0:
             return 100  # No test files to analyze
 
-        # Penalties per issue
-        penalties = {
-            "critical": 20,
-            "high": 10,
-            "medium": 3,
-            "low": 1,
-            "info": 0,
-        }
-
         total_penalty = sum(
-            count * penalties.get(severity, 0) for severity, count in by_severity.items()
+            count * penalty
+            for count, penalty in zip(severity_counts, SEVERITY_PENALTIES, strict=True)
         )
 
         return max(0, 100 - total_penalty)
 
-    def _create_skip_result(self, reason: str, start_time: float) -> ToolResult:
+    def _create_skip_result(self, reason: str, start_ns: int) -> ToolResult:
         """Create a skip result."""
         return ToolResult(
             tool_name="test_quality",
@@ -166,12 +278,12 @@ class TestQualityAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={"skip_reason": reason},
             error_message="",
         )
 
-    def _create_error_result(self, error: str, start_time: float) -> ToolResult:
+    def _create_error_result(self, error: str, start_ns: int) -> ToolResult:
         """Create an error result."""
         return ToolResult(
             tool_name="test_quality",
@@ -180,7 +292,7 @@ class TestQualityAdapter:
             findings_count=0,
             findings=[],
             findings_by_severity={},
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             metadata={},
             error_message=error,
         )
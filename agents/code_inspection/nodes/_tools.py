@@ -0,0 +1,16 @@
+"""Helpers shared by the inspection phase nodes.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+from collections.abc import Awaitable
+from typing import Any
+
+
+async def run_tool(tool_name: str, task: Awaitable[Any]) -> tuple[str, Any]:
+    """Await a tool, returning its name with the result or the exception raised."""
+    try:
+        return tool_name, await task
+    except Exception as e:
+        return tool_name, e
@@ -19,6 +19,7 @@ from typing import Any
 
 from ..adapters import CodeReviewAdapter, DebuggingAdapter
 from ..state import CodeInspectionState, InspectionPhase, add_audit_entry
+from ._tools import run_tool
 
 logger = logging.getLogger(__name__)
 
@@ -72,52 +73,23 @@ async def run_dynamic_analysis(state: CodeInspectionState) -> CodeInspectionStat
         state["completed_phases"].append(InspectionPhase.DYNAMIC_ANALYSIS.value)
         return state
 
-    # Run tasks (can be parallel or sequential)
+    # Run tasks (can be parallel or sequential). Each tool's result is
+    # stored as soon as it finishes, so a slow tool doesn't hold back the rest
+    total_findings = 0
+    historical_matches: list[Any] = []
+
     if state.get("parallel_mode", True) and len(tasks) > 1:
         logger.info(f"Running {len(tasks)} dynamic tools in parallel: {task_names}")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for next_done in asyncio.as_completed(
+            [run_tool(name, task) for name, task in zip(task_names, tasks, strict=True)],
+        ):
+            tool_name, result = await next_done
+            total_findings += _store_result(state, tool_name, result, historical_matches)
     else:
         logger.info(f"Running {len(tasks)} dynamic tools: {task_names}")
-        results = []
-        for task in tasks:
-            try:
-                result = await task
-                results.append(result)
-            except Exception as e:
-                results.append(e)
-
-    # Process results
-    total_findings = 0
-    historical_matches = []
-
-    for i, result in enumerate(results):
-        tool_name = task_names[i]
-
-        if isinstance(result, Exception):
-            logger.error(f"Tool {tool_name} failed: {result}")
-            state["errors"].append(f"{tool_name}: {result!s}")
-            continue
-
-        # Store result
-        state["dynamic_analysis_results"][tool_name] = result
-
-        # Also store in individual fields
-        if tool_name == "code_review":
-            state["code_review_result"] = result
-        elif tool_name == "memory_debugging":
-            state["memory_debugging_result"] = result
-            # Extract historical matches
-            historical_matches.extend(result.get("metadata", {}).get("historical_matches", []))
-        elif tool_name == "advanced_debugging":
-            state["advanced_debugging_result"] = result
-
-        total_findings += result.get("findings_count", 0)
-
-        logger.info(
-            f"{tool_name}: status={result.get('status')}, "
-            f"score={result.get('score')}, "
-            f"findings={result.get('findings_count')}",
-        )
+        for name, task in zip(task_names, tasks, strict=True):
+            tool_name, result = await run_tool(name, task)
+            total_findings += _store_result(state, tool_name, result, historical_matches)
 
     # Update state
     state["historical_patterns_matched"] = historical_matches
@@ -140,6 +112,45 @@ async def run_dynamic_analysis(state: CodeInspectionState) -> CodeInspectionStat
     return state
 
 
+def _store_result(
+    state: CodeInspectionState,
+    tool_name: str,
+    result: Any,
+    historical_matches: list[Any],
+) -> int:
+    """Record one tool's result in state.
+
+    Returns:
+        Number of findings the tool reported (0 if it failed)
+
+    """
+    if isinstance(result, Exception):
+        logger.error(f"Tool {tool_name} failed: {result}")
+        state["errors"].append(f"{tool_name}: {result!s}")
+        return 0
+
+    # Store result
+    state["dynamic_analysis_results"][tool_name] = result
+
+    # Also store in individual fields
+    if tool_name == "code_review":
+        state["code_review_result"] = result
+    elif tool_name == "memory_debugging":
+        state["memory_debugging_result"] = result
+        # Extract historical matches
+        historical_matches.extend(result.get("metadata", {}).get("historical_matches", []))
+    elif tool_name == "advanced_debugging":
+        state["advanced_debugging_result"] = result
+
+    logger.info(
+        f"{tool_name}: status={result.get('status')}, "
+        f"score={result.get('score')}, "
+        f"findings={result.get('findings_count')}",
+    )
+
+    return result.get("findings_count", 0)
+
+
 async def run_deep_dive_analysis(state: CodeInspectionState) -> CodeInspectionState:
     """Deep-dive analysis triggered by historical pattern matches.
 
@@ -166,20 +177,22 @@ async def run_deep_dive_analysis(state: CodeInspectionState) -> CodeInspectionSt
         config=state["tool_configs"].get("advanced_debugging"),
     )
 
-    try:
-        result = await adapter.analyze_advanced()
-        state["dynamic_analysis_results"]["advanced_debugging"] = result
-        state["advanced_debugging_result"] = result
+    async def _run_advanced() -> None:
+        try:
+            result = await adapter.analyze_advanced()
+            state["dynamic_analysis_results"]["advanced_debugging"] = result
+            state["advanced_debugging_result"] = result
 
-        logger.info(
-            f"Deep-dive: status={result.get('status')}, findings={result.get('findings_count')}",
-        )
-    except Exception as e:
-        logger.error(f"Deep-dive analysis failed: {e}")
-        state["errors"].append(f"deep_dive: {e!s}")
+            logger.info(
+                f"Deep-dive: status={result.get('status')}, findings={result.get('findings_count')}",
+            )
+        except Exception as e:
+            logger.error(f"Deep-dive analysis failed: {e}")
+            state["errors"].append(f"deep_dive: {e!s}")
 
-    # Also run standard dynamic analysis
-    state = await run_dynamic_analysis(state)
+    # Also run standard dynamic analysis - it doesn't depend on the
+    # advanced debugging result, so the two run concurrently
+    _, state = await asyncio.gather(_run_advanced(), run_dynamic_analysis(state))
 
     add_audit_entry(
         state,
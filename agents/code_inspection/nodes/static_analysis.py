@@ -15,10 +15,20 @@ Licensed under Fair Source 0.9
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import aclosing
 from datetime import datetime
+from typing import Any
 
 from ..adapters import CodeHealthAdapter, SecurityAdapter, TechDebtAdapter, TestQualityAdapter
 from ..state import CodeInspectionState, InspectionPhase, add_audit_entry
+from ._tools import run_tool
+
+# Optional LangChain integration
+try:
+    from langchain_core.messages import AIMessage
+except ImportError:
+    AIMessage = None  # type: ignore[assignment,misc]
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +36,8 @@ logger = logging.getLogger(__name__)
 async def run_static_analysis(state: CodeInspectionState) -> CodeInspectionState:
     """Phase 1: Run all static analysis tools in parallel.
 
-    Following the asyncio.gather pattern from book_production/pipeline.py.
+    Results are stored as each tool completes (asyncio.as_completed), so
+    one slow tool doesn't hold up recording the others.
 
     Args:
         state: Current inspection state
@@ -40,11 +51,81 @@ async def run_static_analysis(state: CodeInspectionState) -> CodeInspectionState
     state["current_phase"] = InspectionPhase.STATIC_ANALYSIS.value
     add_audit_entry(state, "static_analysis", "Starting Phase 1: Static Analysis")
 
+    tasks, task_names = _build_tool_tasks(state)
+
+    if not tasks:
+        logger.warning("No static analysis tools enabled")
+        state["completed_phases"].append(InspectionPhase.STATIC_ANALYSIS.value)
+        return state
+
+    # Run all tasks in parallel (or sequentially if parallel mode disabled).
+    # Each tool's result is stored as soon as it finishes
+    parallel = state.get("parallel_mode", True)
+    mode = "in parallel" if parallel else "sequentially"
+    logger.info(f"Running {len(tasks)} tools {mode}: {task_names}")
+
+    total_findings = 0
+    critical_count = 0
+
+    async with aclosing(_iter_tool_results(tasks, task_names, parallel)) as tool_results:
+        async for tool_name, result in tool_results:
+            findings, critical = _store_result(state, tool_name, result)
+            total_findings += findings
+            critical_count += critical
+
+    # Update state with aggregates
+    state["static_findings_count"] = total_findings
+    state["static_critical_count"] = critical_count
+    state["completed_phases"].append(InspectionPhase.STATIC_ANALYSIS.value)
+    state["last_updated"] = datetime.now().isoformat()
+
+    # Add message for audit trail
+    if AIMessage is not None:
+        state["messages"].append(
+            AIMessage(
+                content=f"Static analysis complete: {len(tasks)} tools run, "
+                f"{total_findings} findings ({critical_count} critical)",
+            ),
+        )
+
+    # One lookup per tool that produced a result
+    static_results = state["static_analysis_results"]
+    results_summary = {
+        name: {
+            "status": result.get("status"),
+            "score": result.get("score"),
+            "findings": result.get("findings_count"),
+        }
+        for name in task_names
+        if (result := static_results.get(name)) is not None
+    }
+
+    add_audit_entry(
+        state,
+        "static_analysis",
+        "Phase 1 complete",
+        {
+            "tools_run": task_names,
+            "total_findings": total_findings,
+            "critical_count": critical_count,
+            "results_summary": results_summary,
+        },
+    )
+
+    logger.info(f"[Phase 1] Complete: {total_findings} findings, {critical_count} critical")
+
+    return state
+
+
+def _build_tool_tasks(
+    state: CodeInspectionState,
+) -> tuple[list[Coroutine[Any, Any, Any]], list[str]]:
+    """Create the analyze() coroutine for each enabled Phase 1 tool."""
     project_path = state["project_path"]
     enabled_tools = state["enabled_tools"]
 
     # Build list of tasks for enabled tools
-    tasks = []
+    tasks: list[Coroutine[Any, Any, Any]] = []
     task_names = []
 
     if enabled_tools.get("code_health", True):
@@ -80,101 +161,71 @@ async def run_static_analysis(state: CodeInspectionState) -> CodeInspectionState
         tasks.append(adapter.analyze())
         task_names.append("test_quality")
 
-    if not tasks:
-        logger.warning("No static analysis tools enabled")
-        state["completed_phases"].append(InspectionPhase.STATIC_ANALYSIS.value)
-        return state
-
-    # Run all tasks in parallel (or sequentially if parallel mode disabled)
-    if state.get("parallel_mode", True):
-        logger.info(f"Running {len(tasks)} tools in parallel: {task_names}")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-    else:
-        logger.info(f"Running {len(tasks)} tools sequentially: {task_names}")
-        results = []
-        for task in tasks:
-            try:
-                result = await task
-                results.append(result)
-            except Exception as e:
-                results.append(e)
-
-    # Process results
-    total_findings = 0
-    critical_count = 0
-
-    for i, result in enumerate(results):
-        tool_name = task_names[i]
-
-        if isinstance(result, Exception):
-            logger.error(f"Tool {tool_name} failed: {result}")
-            state["errors"].append(f"{tool_name}: {result!s}")
-            continue
-
-        # Store result
-        state["static_analysis_results"][tool_name] = result
-
-        # Also store in individual fields for easy access
-        if tool_name == "code_health":
-            state["code_health_result"] = result
-        elif tool_name == "security":
-            state["security_scan_result"] = result
-        elif tool_name == "test_quality":
-            state["test_quality_result"] = result
-        elif tool_name == "tech_debt":
-            state["tech_debt_result"] = result
-
-        # Aggregate counts
-        total_findings += result.get("findings_count", 0)
-        critical_count += result.get("findings_by_severity", {}).get("critical", 0)
-
-        logger.info(
-            f"{tool_name}: status={result.get('status')}, "
-            f"score={result.get('score')}, "
-            f"findings={result.get('findings_count')}",
-        )
+    return tasks, task_names
+
+
+async def _iter_tool_results(
+    tasks: list[Coroutine[Any, Any, Any]],
+    task_names: list[str],
+    parallel: bool,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Await tools, yielding (tool_name, result or exception) as each finishes."""
+    if not parallel:
+        try:
+            for name, task in zip(task_names, tasks, strict=True):
+                yield await run_tool(name, task)
+        finally:
+            # Don't leave never-awaited coroutines if the consumer stops early
+            for task in tasks:
+                task.close()
+        return
+
+    # Named tasks make a stuck tool identifiable in asyncio task dumps
+    running = [
+        asyncio.create_task(run_tool(name, task), name=f"static_analysis:{name}")
+        for name, task in zip(task_names, tasks, strict=True)
+    ]
+    try:
+        for next_done in asyncio.as_completed(running):
+            yield await next_done
+    finally:
+        # Stop outstanding tools if the consumer stops early
+        for task in running:
+            task.cancel()
 
-    # Update state with aggregates
-    state["static_findings_count"] = total_findings
-    state["static_critical_count"] = critical_count
-    state["completed_phases"].append(InspectionPhase.STATIC_ANALYSIS.value)
-    state["last_updated"] = datetime.now().isoformat()
 
-    # Add message for audit trail
-    try:
-        from langchain_core.messages import AIMessage
+def _store_result(state: CodeInspectionState, tool_name: str, result: Any) -> tuple[int, int]:
+    """Record one tool's result in state.
 
-        state["messages"].append(
-            AIMessage(
-                content=f"Static analysis complete: {len(tasks)} tools run, "
-                f"{total_findings} findings ({critical_count} critical)",
-            ),
-        )
-    except ImportError:
-        pass
+    Returns:
+        (findings, critical findings) the tool reported, (0, 0) if it failed
 
-    add_audit_entry(
-        state,
-        "static_analysis",
-        "Phase 1 complete",
-        {
-            "tools_run": task_names,
-            "total_findings": total_findings,
-            "critical_count": critical_count,
-            "results_summary": {
-                name: {
-                    "status": state["static_analysis_results"].get(name, {}).get("status"),
-                    "score": state["static_analysis_results"].get(name, {}).get("score"),
-                    "findings": state["static_analysis_results"]
-                    .get(name, {})
-                    .get("findings_count"),
-                }
-                for name in task_names
-                if name in state["static_analysis_results"]
-            },
-        },
+    """
+    if isinstance(result, Exception):
+        logger.error(f"Tool {tool_name} failed: {result}")
+        state["errors"].append(f"{tool_name}: {result!s}")
+        return 0, 0
+
+    # Store result
+    state["static_analysis_results"][tool_name] = result
+
+    # Also store in individual fields for easy access
+    if tool_name == "code_health":
+        state["code_health_result"] = result
+    elif tool_name == "security":
+        state["security_scan_result"] = result
+    elif tool_name == "test_quality":
+        state["test_quality_result"] = result
+    elif tool_name == "tech_debt":
+        state["tech_debt_result"] = result
+
+    logger.info(
+        f"{tool_name}: status={result.get('status')}, "
+        f"score={result.get('score')}, "
+        f"findings={result.get('findings_count')}",
     )
 
-    logger.info(f"[Phase 1] Complete: {total_findings} findings, {critical_count} critical")
-
-    return state
+    return (
+        result.get("findings_count", 0),
+        result.get("findings_by_severity", {}).get("critical", 0),
+    )
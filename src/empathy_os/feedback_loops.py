@@ -242,9 +242,10 @@ class FeedbackLoopDetector:
         if success_rate < 0.6:
             return False
 
-        # Check for acceleration (reinforcing behavior)
+        # Check for acceleration (reinforcing behavior) against the overall
+        # trend computed above
         recent_trust_trend = self._calculate_trend(trust_values[-3:])
-        overall_trust_trend = self._calculate_trend(trust_values)
+        overall_trust_trend = trust_trend
 
         is_accelerating = recent_trust_trend > overall_trust_trend
 
@@ -290,9 +291,10 @@ class FeedbackLoopDetector:
         if failure_rate < 0.4:
             return False
 
-        # Check for acceleration (reinforcing behavior)
+        # Check for acceleration (reinforcing behavior) against the overall
+        # trend computed above
         recent_trust_trend = self._calculate_trend(trust_values[-3:])
-        overall_trust_trend = self._calculate_trend(trust_values)
+        overall_trust_trend = trust_trend
 
         is_accelerating_down = recent_trust_trend < overall_trust_trend
 
@@ -333,16 +335,14 @@ class FeedbackLoopDetector:
             return 0.0
 
         n = len(values)
-        # x_mean is sum(0,1,...,n-1)/n = (n-1)/2
+        # x is range(n), so x_mean = (n-1)/2 and sum((x - x_mean)**2) has the
+        # closed form n(n^2 - 1)/12, which is nonzero for n >= 2. The numerator
+        # stays centered: expanding it to sum(x*y) - x_mean*sum(y) loses
+        # precision to cancellation, and callers compare trends strictly
         x_mean = (n - 1) / 2
         y_mean = sum(values) / n
-
-        # Use i directly instead of x[i] since x would just be range(n)
-        numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
-            return 0.0
+        numerator = sum((i - x_mean) * (value - y_mean) for i, value in enumerate(values))
+        denominator = n * (n * n - 1) / 12
 
         slope = numerator / denominator
         return slope
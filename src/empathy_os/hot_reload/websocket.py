@@ -7,6 +7,7 @@ Licensed under Fair Source 0.9
 """
 
 import asyncio
+import json
 import logging
 from collections.abc import Callable
 from typing import Any
@@ -15,6 +16,19 @@ from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Broadcasts are serialized once and sent as the same text frame
+# send_json would produce; orjson is used when installed
+try:
+    import orjson
+
+    def _dumps(message: dict[str, Any]) -> str:
+        return orjson.dumps(message).decode("utf-8")
+
+except ImportError:
+
+    def _dumps(message: dict[str, Any]) -> str:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
 
 class ReloadNotificationManager:
     """Manages WebSocket connections for hot-reload notifications.
@@ -22,9 +36,16 @@ class ReloadNotificationManager:
     Broadcasts reload events to all connected clients.
     """
 
-    def __init__(self):
-        """Initialize notification manager."""
-        self._connections: list[WebSocket] = []
+    def __init__(self, send_timeout: float = 5.0):
+        """Initialize notification manager.
+
+        Args:
+            send_timeout: Seconds to wait on one client's send before
+                dropping it from a broadcast
+
+        """
+        self._send_timeout = send_timeout
+        self._connections: set[WebSocket] = set()
         self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket) -> None:
@@ -37,7 +58,7 @@ class ReloadNotificationManager:
         await websocket.accept()
 
         async with self._lock:
-            self._connections.append(websocket)
+            self._connections.add(websocket)
 
         logger.info(f"WebSocket connected (total: {len(self._connections)})")
 
@@ -59,8 +80,7 @@ class ReloadNotificationManager:
 
         """
         async with self._lock:
-            if websocket in self._connections:
-                self._connections.remove(websocket)
+            self._connections.discard(websocket)
 
         logger.info(f"WebSocket disconnected (remaining: {len(self._connections)})")
 
@@ -76,24 +96,30 @@ class ReloadNotificationManager:
             return
 
         async with self._lock:
-            # Create a copy to avoid modification during iteration
-            connections = self._connections.copy()
+            # Snapshot to avoid modification during iteration
+            connections = list(self._connections)
+
+        # Serialize once, then send to all connections concurrently. Each
+        # send is bounded so one slow client can't stall the broadcast
+        payload = _dumps(message)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(websocket.send_text(payload), self._send_timeout)
+                for websocket in connections
+            ),
+            return_exceptions=True,
+        )
 
-        # Broadcast to all connections
         disconnected = []
-        for websocket in connections:
-            try:
-                await self._send_to_client(websocket, message)
-            except Exception as e:
-                logger.error(f"Error sending to client: {e}")
+        for websocket, result in zip(connections, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to client: {result}")
                 disconnected.append(websocket)
 
         # Remove disconnected clients
         if disconnected:
             async with self._lock:
-                for websocket in disconnected:
-                    if websocket in self._connections:
-                        self._connections.remove(websocket)
+                self._connections.difference_update(disconnected)
 
             logger.info(f"Removed {len(disconnected)} disconnected clients")
 
@@ -110,7 +136,7 @@ class ReloadNotificationManager:
 
         """
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(_dumps(message))
         except Exception as e:
             logger.error(f"Failed to send message to client: {e}")
             raise
@@ -1211,15 +1211,22 @@ class RedisShortTermMemory:
 
         if self._client is None:
             return {"mode": "disconnected", "error": "No Redis client"}
-        info = self._client.info("memory")
+        # One round-trip for all stats commands
+        pipe = self._client.pipeline(transaction=False)
+        pipe.info("memory")
+        pipe.dbsize()
+        pipe.keys(f"{self.PREFIX_WORKING}*")
+        pipe.keys(f"{self.PREFIX_STAGED}*")
+        pipe.keys(f"{self.PREFIX_CONFLICT}*")
+        info, total_keys, working_keys, staged_keys, conflict_keys = pipe.execute()
         return {
             "mode": "redis",
             "used_memory": info.get("used_memory_human"),
             "peak_memory": info.get("used_memory_peak_human"),
-            "total_keys": self._client.dbsize(),
-            "working_keys": len(self._keys(f"{self.PREFIX_WORKING}*")),
-            "staged_keys": len(self._keys(f"{self.PREFIX_STAGED}*")),
-            "conflict_keys": len(self._keys(f"{self.PREFIX_CONFLICT}*")),
+            "total_keys": total_keys,
+            "working_keys": len(working_keys),
+            "staged_keys": len(staged_keys),
+            "conflict_keys": len(conflict_keys),
         }
 
     def get_metrics(self) -> dict:
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PatternCategory(Enum):
@@ -70,7 +70,4 @@ class WorkflowPattern(BaseModel):
         """
         raise NotImplementedError("Subclasses must implement generate_code_sections")
 
-    class Config:
-        """Pydantic config."""
-
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
@@ -16,7 +16,9 @@ Licensed under Fair Source License 0.9
 import fnmatch
 import json
 import logging
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -109,6 +111,32 @@ def _should_exclude_file(file_path: str, exclude_patterns: list[str]) -> bool:
     return False
 
 
+def _iter_files(root: Path, prune_dirs: frozenset[str]) -> Iterator[Path]:
+    """Yield every file under root, skipping directories named in prune_dirs.
+
+    A single os.scandir walk with an explicit stack: pruned directories are
+    never opened, and entry types come from the directory listing, so no
+    per-file stat is needed. Symlinked directories are not followed, and
+    unreadable directories are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in prune_dirs:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
 def _is_acceptable_broad_exception(
     line: str,
     context_before: list[str],
@@ -501,8 +529,16 @@ class BugPredictionWorkflow(BaseWorkflow):
         # Walk directory and collect file info
         target = Path(target_path)
         if target.exists():
+            # Walk the tree once for all file types, pruning excluded
+            # directories, then visit files type by type
+            files_by_type: dict[str, list[Path]] = {ext: [] for ext in file_types}
+            for file_path in _iter_files(target, frozenset(exclude_dirs)):
+                for ext in file_types:
+                    if file_path.name.endswith(ext):
+                        files_by_type[ext].append(file_path)
+
             for ext in file_types:
-                for file_path in target.rglob(f"*{ext}"):
+                for file_path in files_by_type[ext]:
                     # Skip excluded directories
                     path_str = str(file_path)
                     if any(excl in path_str for excl in exclude_dirs):
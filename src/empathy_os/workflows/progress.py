@@ -30,7 +30,7 @@ class ProgressStatus(Enum):
     RETRYING = "retrying"  # Retrying after error
 
 
-@dataclass
+@dataclass(slots=True)
 class StageProgress:
     """Progress information for a single stage."""
 
@@ -67,7 +67,7 @@ class StageProgress:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressUpdate:
     """A progress update to be broadcast."""
 
@@ -40,6 +40,33 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Frames are serialized with orjson when installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(message: dict[str, Any]) -> str:
+        return orjson.dumps(message).decode("utf-8")
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(message: dict[str, Any]) -> str:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+# Heartbeat frames as clients usually send them, matched before parsing
+_PING_FRAMES = frozenset(
+    {
+        '{"type":"ping"}',
+        '{"type": "ping"}',
+        b'{"type":"ping"}',
+        b'{"type": "ping"}',
+    },
+)
+_PONG_FRAME = _dumps({"type": "pong"})
+
 
 @dataclass
 class ProgressServerConfig:
@@ -50,6 +77,11 @@ class ProgressServerConfig:
     ping_interval: float = 20.0
     ping_timeout: float = 20.0
     max_connections: int = 100
+    send_timeout: float = 5.0
+    send_queue_size: int = 256
+    # permessage-deflate compresses every broadcast once per client; progress
+    # frames are small, so it is off unless set to "deflate"
+    compression: str | None = None
 
 
 class ProgressServer:
@@ -68,6 +100,9 @@ class ProgressServer:
 
         self.config = config or ProgressServerConfig()
         self._clients: set[WebSocketServerProtocol] = set()
+        # Frames waiting for each client's writer task; None tells the writer
+        # to close the connection
+        self._outboxes: dict[WebSocketServerProtocol, asyncio.Queue[str | None]] = {}
         self._server: Any = None
         self._running = False
         self._trackers: dict[str, ProgressTracker] = {}
@@ -82,6 +117,7 @@ class ProgressServer:
             self.config.port,
             ping_interval=self.config.ping_interval,
             ping_timeout=self.config.ping_timeout,
+            compression=self.config.compression,
         )
 
         logger.info(f"Progress server started on ws://{self.config.host}:{self.config.port}")
@@ -97,6 +133,7 @@ class ProgressServer:
                 return_exceptions=True,
             )
             self._clients.clear()
+            self._outboxes.clear()
 
         # Close server
         if self._server:
@@ -115,10 +152,22 @@ class ProgressServer:
         client_id = id(websocket)
         logger.debug(f"Client {client_id} connected. Total clients: {len(self._clients)}")
 
+        # Broadcasts are queued and sent by a dedicated writer, so a slow
+        # client never holds up the producer
+        # Unbounded so the close sentinel always fits; broadcast() enforces
+        # send_queue_size
+        outbox: asyncio.Queue[str | None] = asyncio.Queue()
+        self._outboxes[websocket] = outbox
+        writer = asyncio.create_task(
+            self._write_loop(websocket, outbox),
+            name=f"progress_writer:{client_id}",
+        )
+
         try:
-            # Send welcome message with current state
-            await websocket.send(
-                json.dumps(
+            # Send welcome message with current state, ahead of any broadcast
+            self._enqueue(
+                websocket,
+                _dumps(
                     {
                         "type": "connected",
                         "message": "Connected to Empathy progress server",
@@ -135,30 +184,47 @@ class ProgressServer:
             pass
         finally:
             self._clients.discard(websocket)
+            self._outboxes.pop(websocket, None)
+            writer.cancel()
             logger.debug(f"Client {client_id} disconnected. Total clients: {len(self._clients)}")
 
-    async def _handle_message(self, websocket: WebSocketServerProtocol, message: str) -> None:
-        """Handle incoming message from client."""
+    async def _handle_message(
+        self,
+        websocket: WebSocketServerProtocol,
+        message: str | bytes,
+    ) -> None:
+        """Handle incoming message from client.
+
+        Replies go through the client's outbox like broadcasts, so they
+        reach it in order after the welcome frame.
+        """
+        # Heartbeats are most of the traffic; answer them without parsing
+        if message in _PING_FRAMES:
+            self._enqueue(websocket, _PONG_FRAME)
+            return
+
         try:
-            data = json.loads(message)
+            data = _loads(message)
             msg_type = data.get("type")
 
             if msg_type == "ping":
-                await websocket.send(json.dumps({"type": "pong"}))
+                self._enqueue(websocket, _PONG_FRAME)
 
             elif msg_type == "subscribe":
                 # Client wants updates for specific workflow
                 workflow_id = data.get("workflow_id")
                 if workflow_id:
                     # Could track per-client subscriptions here
-                    await websocket.send(
-                        json.dumps({"type": "subscribed", "workflow_id": workflow_id}),
+                    self._enqueue(
+                        websocket,
+                        _dumps({"type": "subscribed", "workflow_id": workflow_id}),
                     )
 
             elif msg_type == "get_status":
                 # Client wants current status of all workflows
-                await websocket.send(
-                    json.dumps(
+                self._enqueue(
+                    websocket,
+                    _dumps(
                         {
                             "type": "status",
                             "active_workflows": list(self._trackers.keys()),
@@ -168,27 +234,58 @@ class ProgressServer:
                 )
 
         except json.JSONDecodeError:
-            await websocket.send(json.dumps({"type": "error", "message": "Invalid JSON"}))
+            self._enqueue(websocket, _dumps({"type": "error", "message": "Invalid JSON"}))
 
     async def broadcast(self, update: ProgressUpdate) -> None:
-        """Broadcast a progress update to all connected clients."""
-        if not self._clients:
+        """Broadcast a progress update to all connected clients.
+
+        The update is queued for each client's writer task, so this returns
+        without waiting on the network.
+        """
+        if not self._outboxes:
             return
 
-        message = json.dumps({"type": "progress", **update.to_dict()})
+        message = _dumps({"type": "progress", **update.to_dict()})
 
-        # Broadcast to all clients
-        await asyncio.gather(
-            *[self._send_safe(client, message) for client in self._clients],
-            return_exceptions=True,
-        )
+        for client in list(self._outboxes):
+            self._enqueue(client, message)
+
+    def _enqueue(self, client: WebSocketServerProtocol, message: str) -> None:
+        """Queue a frame for a client's writer, disconnecting it if it lags."""
+        outbox = self._outboxes.get(client)
+        if outbox is None:
+            # Already disconnected
+            return
+        if outbox.qsize() >= self.config.send_queue_size:
+            # One outbox carries every workflow's updates, so dropping
+            # frames could lose another workflow's final status. Drop
+            # the lagging client instead; it gets fresh state on reconnect
+            logger.warning(f"Client {id(client)} send queue full, disconnecting")
+            del self._outboxes[client]
+            while not outbox.empty():
+                outbox.get_nowait()
+            outbox.put_nowait(None)
+            return
+        outbox.put_nowait(message)
 
-    async def _send_safe(self, client: WebSocketServerProtocol, message: str) -> None:
-        """Send message to client with error handling."""
+    async def _write_loop(
+        self,
+        client: WebSocketServerProtocol,
+        outbox: asyncio.Queue[str | None],
+    ) -> None:
+        """Send queued frames to one client until it disconnects or stalls."""
         try:
-            await client.send(message)
+            while True:
+                message = await outbox.get()
+                if message is None:
+                    await client.close(1013, "Client too slow")
+                    return
+                await asyncio.wait_for(client.send(message), self.config.send_timeout)
         except websockets.exceptions.ConnectionClosed:
-            self._clients.discard(client)
+            pass
+        except asyncio.TimeoutError:
+            logger.warning(f"Client {id(client)} too slow, disconnecting")
+            await client.close(1013, "Client too slow")
 
     def create_tracker(
         self,
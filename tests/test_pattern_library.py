@@ -165,6 +165,38 @@ class TestPatternLibrary:
 
         assert all(m.pattern.pattern_type == "sequential" for m in matches)
 
+    def test_query_patterns_uses_context_and_tag_indexes(self):
+        """Test that indexed candidates match a full scan, ties in contribution order"""
+        library = PatternLibrary()
+        for i, (context, tags) in enumerate(
+            [
+                ({"task": "debug"}, []),
+                ({"other": 1}, []),
+                ({}, ["urgent"]),
+                ({"task": "debug"}, []),
+            ],
+        ):
+            library.contribute_pattern(
+                "agent1",
+                Pattern(
+                    id=f"pat_{i}",
+                    agent_id="agent1",
+                    pattern_type="conditional",
+                    name=f"Pattern {i}",
+                    description="Test",
+                    context=context,
+                    confidence=0.8,
+                    tags=tags,
+                ),
+            )
+
+        # Tag match (0.3) plus success boost (0.2) ties with the context matches
+        library.record_pattern_outcome("pat_2", success=True)
+
+        matches = library.query_patterns("agent2", {"task": "debug", "tags": ["urgent"]})
+
+        assert [m.pattern.id for m in matches] == ["pat_0", "pat_2", "pat_3"]
+
     def test_record_pattern_outcome(self):
         """Test recording pattern usage outcomes"""
         library = PatternLibrary()
@@ -0,0 +1,50 @@
+"""Tests for debugging_adapter.py finding numbering.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import json
+
+import pytest
+
+from agents.code_inspection.adapters.debugging_adapter import DebuggingAdapter
+
+
+@pytest.fixture
+def temp_project(tmp_path):
+    """Create a project with resolved and unresolved bug patterns."""
+    patterns_dir = tmp_path / "patterns" / "debugging"
+    patterns_dir.mkdir(parents=True)
+    for i, status in enumerate(["investigating", "resolved", "investigating"]):
+        (patterns_dir / f"bug_{i}.json").write_text(
+            json.dumps({"error_type": "null_reference", "status": status, "file_path": "a.py"}),
+        )
+    return tmp_path
+
+
+class TestMemoryEnhancedFindings:
+    """Test findings from the historical bug pattern scan."""
+
+    @pytest.mark.asyncio
+    async def test_finding_ids_numbered_after_filtering(self, temp_project):
+        """Resolved patterns are skipped without leaving gaps in the IDs."""
+        adapter = DebuggingAdapter(str(temp_project))
+
+        result = await adapter.analyze_memory_enhanced()
+
+        assert [f["finding_id"] for f in result["findings"]] == ["md_0", "md_1"]
+        assert result["findings_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_findings_streamed_to_output_path(self, temp_project, tmp_path):
+        """With output_path set, findings are written as JSON lines."""
+        output_path = tmp_path / "findings.jsonl"
+        adapter = DebuggingAdapter(str(temp_project), config={"output_path": output_path})
+
+        result = await adapter.analyze_memory_enhanced()
+
+        lines = output_path.read_text().splitlines()
+        assert result["findings"] == []
+        assert [json.loads(line)["finding_id"] for line in lines] == ["md_0", "md_1"]
+        assert result["metadata"]["findings_path"] == str(output_path)
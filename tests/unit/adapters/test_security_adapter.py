@@ -0,0 +1,377 @@
+"""Tests for security_adapter.py file scanning.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agents.code_inspection.adapters._paths import iter_py_files
+from agents.code_inspection.adapters._process_pool import shutdown_process_pools
+from agents.code_inspection.adapters.security_adapter import SecurityAdapter
+
+SCANNER_MODULE = "empathy_software_plugin.wizards.security.vulnerability_scanner"
+SCANNER_PATH = f"{SCANNER_MODULE}.VulnerabilityScanner"
+FINGERPRINT_PATH = "agents.code_inspection.adapters._scan_cache._source_fingerprint"
+
+
+@pytest.fixture
+def temp_project(tmp_path):
+    """Create a temporary project with several files and excluded directories."""
+    (tmp_path / "src").mkdir()
+    for i in range(5):
+        (tmp_path / "src" / f"module_{i}.py").write_text(f"value = {i}")
+    for excluded in (".venv", "venv", "node_modules", "__pycache__", "build"):
+        (tmp_path / excluded).mkdir()
+        (tmp_path / excluded / "ignored.py").write_text("ignored = True")
+    return tmp_path
+
+
+@pytest.fixture
+def mock_scanner():
+    """Create a mock VulnerabilityScanner reporting one finding per file."""
+    scanner = Mock()
+    scanner.scan_file = Mock(
+        return_value=[{"vulnerability_type": "EVAL", "severity": "high", "line": 1}],
+    )
+    scanner.scan_dependencies = Mock(return_value=[])
+    return scanner
+
+
+class TestConcurrentScanning:
+    """Test the concurrent per-file scan."""
+
+    @pytest.mark.asyncio
+    async def test_every_file_scanned_once(self, temp_project, mock_scanner):
+        """Each non-excluded file is scanned exactly once."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        scanned = sorted(call.args[0] for call in mock_scanner.scan_file.call_args_list)
+        assert scanned == sorted((temp_project / "src").glob("*.py"))
+        assert result["findings_count"] == 5
+        assert result["findings_by_severity"]["high"] == 5
+        assert result["metadata"]["files_scanned"] == 5
+
+    @pytest.mark.asyncio
+    async def test_project_walked_once(self, temp_project, mock_scanner):
+        """files_scanned comes from the scan itself, not a second tree walk."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with (
+            patch(SCANNER_PATH, return_value=mock_scanner),
+            patch(
+                "agents.code_inspection.adapters.security_adapter.iter_py_files",
+                wraps=iter_py_files,
+            ) as walk,
+        ):
+            result = await adapter.analyze()
+
+        walk.assert_called_once()
+        assert result["metadata"]["files_scanned"] == 5
+
+    @pytest.mark.asyncio
+    async def test_finding_ids_are_unique(self, temp_project, mock_scanner):
+        """Findings gathered from concurrent scans get distinct IDs."""
+        adapter = SecurityAdapter(
+            str(temp_project),
+            config={"max_concurrency": 2},
+            scan_dependencies=False,
+        )
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        finding_ids = [f["finding_id"] for f in result["findings"]]
+        assert len(finding_ids) == len(set(finding_ids))
+
+    @pytest.mark.asyncio
+    async def test_finding_ids_follow_walk_order(self, temp_project, mock_scanner):
+        """IDs are numbered in file walk order, not scan completion order."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        walk_order = [str(p.relative_to(temp_project)) for p in iter_py_files(temp_project)]
+        assert [f["file_path"] for f in result["findings"]] == walk_order
+        assert [f["finding_id"] for f in result["findings"]] == [f"sec_{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_finding_paths_are_project_relative(self, temp_project, mock_scanner):
+        """Finding file paths are relative to the project root."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        paths = sorted(f["file_path"] for f in result["findings"])
+        assert paths == [str(Path("src") / f"module_{i}.py") for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_batched_scan_isolates_failing_file(self, temp_project, mock_scanner):
+        """A file that fails mid-batch doesn't drop the rest of its batch."""
+
+        def scan_file(path):
+            if path.name == "module_0.py":
+                raise ValueError("parse failure")
+            return [{"vulnerability_type": "EVAL", "severity": "high", "line": 1}]
+
+        mock_scanner.scan_file = Mock(side_effect=scan_file)
+        adapter = SecurityAdapter(
+            str(temp_project),
+            config={"scan_batch_size": 2},
+            scan_dependencies=False,
+        )
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        assert mock_scanner.scan_file.call_count == 5
+        codes = sorted(f["code"] for f in result["findings"])
+        assert codes == ["EVAL"] * 4 + ["SCAN_FAILURE"]
+
+
+class TestDependencyScanOverlap:
+    """Test that the dependency scan runs alongside the file scan."""
+
+    @pytest.mark.asyncio
+    async def test_dependency_scan_overlaps_file_scan(self, temp_project, mock_scanner):
+        """File scans can proceed while the dependency scan is still running."""
+        deps_started = threading.Event()
+        overlapped = []
+
+        def scan_dependencies(_requirements_file):
+            deps_started.set()
+            return [{"cve_id": "CVE-1", "severity": "low", "package": "pkg"}]
+
+        def scan_file(_path):
+            # Run sequentially, the dependency scan would not start until
+            # every file scan had returned
+            overlapped.append(deps_started.wait(timeout=5))
+            return []
+
+        mock_scanner.scan_dependencies = Mock(side_effect=scan_dependencies)
+        mock_scanner.scan_file = Mock(side_effect=scan_file)
+        (temp_project / "requirements.txt").write_text("pkg==1.0\n")
+        adapter = SecurityAdapter(str(temp_project), config={"use_cache": False})
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        assert overlapped == [True] * 5
+        assert [f["code"] for f in result["findings"]] == ["CVE-1"]
+
+
+class TestDependencyScan:
+    """Test the dependency CVE scan."""
+
+    @pytest.mark.asyncio
+    async def test_requirements_file_is_scanned(self, temp_project, mock_scanner):
+        """The scanner is given the project's requirements file, not its root."""
+        requirements_file = temp_project / "requirements.txt"
+        requirements_file.write_text("pkg==1.0\n")
+        adapter = SecurityAdapter(str(temp_project), config={"use_cache": False})
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            await adapter.analyze()
+
+        mock_scanner.scan_dependencies.assert_called_once_with(requirements_file)
+
+    @pytest.mark.asyncio
+    async def test_missing_requirements_file_skips_scan(self, temp_project, mock_scanner):
+        """Without a requirements file the dependency scan is not run."""
+        adapter = SecurityAdapter(str(temp_project), config={"use_cache": False})
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        mock_scanner.scan_dependencies.assert_not_called()
+        assert result["status"] != "error"
+
+    @pytest.mark.asyncio
+    async def test_dependency_vulnerabilities_are_mapped(self, temp_project, mock_scanner):
+        """DependencyVulnerability dataclasses become dependency findings."""
+        scanner_module = pytest.importorskip(SCANNER_MODULE)
+        mock_scanner.scan_dependencies = Mock(
+            return_value=[
+                scanner_module.DependencyVulnerability(
+                    package_name="pkg",
+                    installed_version="1.0",
+                    vulnerable_versions="<1.1",
+                    fixed_version="1.1",
+                    cve_id="CVE-2025-0001",
+                    cvss_score=7.5,
+                    severity=scanner_module.Severity.HIGH,
+                    description="Remote code execution",
+                    references=[],
+                ),
+            ],
+        )
+        mock_scanner.scan_file = Mock(return_value=[])
+        (temp_project / "requirements.txt").write_text("pkg==1.0\n")
+        adapter = SecurityAdapter(str(temp_project), config={"use_cache": False})
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            result = await adapter.analyze()
+
+        [finding] = result["findings"]
+        assert (finding["code"], finding["severity"], finding["file_path"]) == (
+            "CVE-2025-0001",
+            "high",
+            "requirements.txt",
+        )
+        assert finding["fix_command"] == "1.1"
+
+
+class TestRealScanner:
+    """Test the adapter against the real VulnerabilityScanner."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_process_pool", [False, True])
+    async def test_known_vulnerability_found(self, tmp_path, use_process_pool):
+        """A SQL query built with string formatting is reported."""
+        pytest.importorskip(SCANNER_MODULE)
+        (tmp_path / "app.py").write_text(
+            "def find(cursor, name):\n"
+            '    cursor.execute("SELECT * FROM users WHERE name = %s" % name)\n',
+        )
+        adapter = SecurityAdapter(
+            str(tmp_path),
+            config={"use_cache": False, "use_process_pool": use_process_pool},
+            scan_dependencies=False,
+        )
+
+        try:
+            result = await adapter.analyze()
+        finally:
+            shutdown_process_pools()
+
+        codes = {(f["code"], f["line_number"]) for f in result["findings"]}
+        assert ("sql_injection", 2) in codes
+        assert "SCAN_FAILURE" not in {code for code, _ in codes}
+
+
+class TestScannerReuse:
+    """Test that the scanner is constructed once per adapter."""
+
+    @pytest.mark.asyncio
+    async def test_scanner_reused_across_runs(self, temp_project, mock_scanner):
+        """Repeated analyze() calls reuse the same scanner instance."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner) as scanner_cls:
+            await adapter.analyze()
+            await adapter.analyze()
+
+        scanner_cls.assert_called_once()
+
+
+class TestScanCache:
+    """Test the content-hash scan result cache."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_served_from_cache(self, temp_project, mock_scanner):
+        """A second run does not rescan files whose contents are unchanged."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            first = await adapter.analyze()
+            second = await adapter.analyze()
+
+        assert mock_scanner.scan_file.call_count == 5
+        assert second["metadata"]["cache_hits"] == 5
+
+        assert second["findings"] == first["findings"]
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_rescanned(self, temp_project, mock_scanner):
+        """Editing a file invalidates its cached result."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            await adapter.analyze()
+            (temp_project / "src" / "module_0.py").write_text("value = 'changed'")
+            result = await adapter.analyze()
+
+        assert mock_scanner.scan_file.call_count == 6
+        assert result["metadata"]["cache_hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_kept_outside_project(self, temp_project, mock_scanner, isolated_home):
+        """The default cache lives in the user's home, not the scanned tree."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            await adapter.analyze()
+
+        assert not (temp_project / ".empathy").exists()
+        assert (isolated_home / ".empathy" / "cache" / "scan_cache.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, temp_project, mock_scanner, isolated_home):
+        """use_cache=False rescans every file and writes no cache."""
+        adapter = SecurityAdapter(
+            str(temp_project),
+            config={"use_cache": False},
+            scan_dependencies=False,
+        )
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            await adapter.analyze()
+            await adapter.analyze()
+
+        assert mock_scanner.scan_file.call_count == 10
+        assert not (temp_project / ".empathy").exists()
+        assert not (isolated_home / ".empathy").exists()
+
+    @pytest.mark.asyncio
+    async def test_scanner_vulnerabilities_are_cached(self, temp_project, mock_scanner):
+        """Vulnerability dataclasses from the real scanner are cached as plain records."""
+        scanner_module = pytest.importorskip(SCANNER_MODULE)
+        mock_scanner.scan_file = Mock(
+            return_value=[
+                scanner_module.Vulnerability(
+                    vuln_type=scanner_module.VulnerabilityType.SQL_INJECTION,
+                    severity=scanner_module.Severity.HIGH,
+                    file_path="src/module.py",
+                    line_number=3,
+                    description="String-formatted SQL query",
+                    evidence="cursor.execute(f'...')",
+                ),
+            ],
+        )
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            first = await adapter.analyze()
+            second = await adapter.analyze()
+
+        assert mock_scanner.scan_file.call_count == 5
+        assert second["metadata"]["cache_hits"] == 5
+        assert second["findings"] == first["findings"]
+        finding = first["findings"][0]
+        assert (finding["code"], finding["severity"], finding["line_number"]) == (
+            "sql_injection",
+            "high",
+            3,
+        )
+
+    @pytest.mark.asyncio
+    async def test_analyzer_change_invalidates_cache(self, temp_project, mock_scanner):
+        """Entries cached by a different scanner or adapter source are not reused."""
+        adapter = SecurityAdapter(str(temp_project), scan_dependencies=False)
+
+        with patch(SCANNER_PATH, return_value=mock_scanner):
+            await adapter.analyze()
+            with patch(FINGERPRINT_PATH, return_value="edited"):
+                result = await adapter.analyze()
+
+        assert mock_scanner.scan_file.call_count == 10
+        assert result["metadata"]["cache_hits"] == 0
@@ -8,7 +8,6 @@ Licensed under Fair Source 0.9
 """
 
 import logging
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -23,6 +22,8 @@ def temp_project(tmp_path):
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "main.py").write_text("print('hello')")
     (tmp_path / "src" / "utils.py").write_text("def helper(): pass")
+    # Dependency manifest for the dependency scan
+    (tmp_path / "requirements.txt").write_text("requests==2.31.0\n")
     return tmp_path
 
 
@@ -296,8 +297,11 @@ class TestAnalyzeMainExceptions:
         """OSError at top level should return error result."""
         adapter = SecurityAdapter(str(temp_project))
 
-        # Mock project_root.rglob to raise OSError
-        with patch.object(Path, "rglob", side_effect=OSError("Permission denied")):
+        # Mock the project walk to raise OSError
+        with patch(
+            "agents.code_inspection.adapters.security_adapter.iter_py_files",
+            side_effect=OSError("Permission denied"),
+        ):
             with patch(
                 "empathy_software_plugin.wizards.security.vulnerability_scanner.VulnerabilityScanner",
                 return_value=Mock(scan_file=Mock(return_value=[])),
@@ -0,0 +1,138 @@
+"""Tests for tech_debt_adapter.py fallback marker scanning.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agents.code_inspection.adapters.tech_debt_adapter import TechDebtAdapter
+
+SAMPLE_SOURCE = """\
+import os
+
+# TODO: Refactor this function
+def main():
+    x = 1  # fixme handle negatives
+    return x
+
+# HACK:
+# XXX
+#
+# TODO next line should not be captured
+"""
+
+
+@pytest.fixture
+def temp_project(tmp_path):
+    """Create a temporary project with one file of debt markers."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text(SAMPLE_SOURCE)
+    return tmp_path
+
+
+class TestFallbackMarkerScan:
+    """Test the regex fallback used when the wizard is unavailable."""
+
+    @pytest.mark.asyncio
+    async def test_markers_found_with_line_numbers(self, temp_project):
+        """Each marker is reported once with its type, line, and message."""
+        adapter = TechDebtAdapter(str(temp_project))
+
+        result = await adapter._fallback_analyze(0)
+
+        found = [(f["line_number"], f["code"], f["message"]) for f in result["findings"]]
+        assert found == [
+            (3, "TODO", "Refactor this function"),
+            (5, "FIXME", "handle negatives"),
+            (8, "HACK", "HACK"),
+            (11, "TODO", "next line should not be captured"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_evidence_is_the_marker_line(self, temp_project):
+        """Evidence is the stripped source line containing the marker."""
+        adapter = TechDebtAdapter(str(temp_project))
+
+        result = await adapter._fallback_analyze(0)
+
+        assert result["findings"][1]["evidence"] == "x = 1  # fixme handle negatives"
+        assert result["findings_by_severity"]["high"] == 2
+        assert result["findings_by_severity"]["low"] == 2
+
+    @pytest.mark.asyncio
+    async def test_several_markers_on_one_line(self, tmp_path):
+        """Each marker on a shared line is reported with its own message."""
+        (tmp_path / "main.py").write_text("x = 1  # TODO: a  # FIXME: b\n")
+        adapter = TechDebtAdapter(str(tmp_path))
+
+        result = await adapter._fallback_analyze(0)
+
+        found = [(f["line_number"], f["code"], f["message"]) for f in result["findings"]]
+        assert found == [(1, "TODO", "a"), (1, "FIXME", "b")]
+        assert {f["evidence"] for f in result["findings"]} == {"x = 1  # TODO: a  # FIXME: b"}
+
+
+class TestFallbackScanCache:
+    """Test the content-hash cache used by the fallback scan."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_served_from_cache(self, temp_project):
+        """A second run reuses cached markers and reports the same findings."""
+        adapter = TechDebtAdapter(str(temp_project))
+
+        first = await adapter._fallback_analyze(0)
+        second = await adapter._fallback_analyze(0)
+
+        assert first["metadata"]["cache_hits"] == 0
+        assert second["metadata"]["cache_hits"] == 1
+        assert second["findings"] == first["findings"]
+
+    @pytest.mark.asyncio
+    async def test_cached_markers_stamped_with_current_path(self, temp_project):
+        """A copy of a cached file is reported under its own path."""
+        adapter = TechDebtAdapter(str(temp_project))
+        await adapter._fallback_analyze(0)
+
+        (temp_project / "src" / "copy.py").write_text(SAMPLE_SOURCE)
+        result = await adapter._fallback_analyze(0)
+
+        assert result["metadata"]["cache_hits"] == 2
+        paths = {f["file_path"] for f in result["findings"]}
+        assert paths == {str(Path("src") / "main.py"), str(Path("src") / "copy.py")}
+
+
+class TestFindingsOutputPath:
+    """Test streaming findings to a JSONL file instead of the result."""
+
+    @pytest.mark.asyncio
+    async def test_findings_written_as_json_lines(self, temp_project, tmp_path):
+        """With output_path set, findings go to the file and the result keeps only counts."""
+        output_path = tmp_path / "findings.jsonl"
+        in_memory = await TechDebtAdapter(str(temp_project))._fallback_analyze(0)
+        adapter = TechDebtAdapter(str(temp_project), config={"output_path": output_path})
+
+        result = await adapter._fallback_analyze(0)
+
+        lines = output_path.read_text().splitlines()
+        assert result["findings"] == []
+        assert result["findings_count"] == len(lines) == 4
+        assert [json.loads(line) for line in lines] == in_memory["findings"]
+        assert result["findings_by_severity"] == in_memory["findings_by_severity"]
+        assert result["metadata"]["findings_path"] == str(output_path)
+        assert "findings_path" not in in_memory["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_shared_output_path_is_appended(self, temp_project, tmp_path):
+        """A second run into the same file adds to it rather than overwriting."""
+        output_path = tmp_path / "findings.jsonl"
+        adapter = TechDebtAdapter(str(temp_project), config={"output_path": output_path})
+
+        first = await adapter._fallback_analyze(0)
+        second = await adapter._fallback_analyze(0)
+
+        lines = output_path.read_text().splitlines()
+        assert len(lines) == first["findings_count"] + second["findings_count"] == 8
@@ -160,9 +160,9 @@ class TestFallbackAnalyzeExceptions:
 
         adapter = TechDebtAdapter(str(tmp_path))
 
-        with patch.object(Path, "read_text", side_effect=PermissionError("Access denied")):
+        with patch.object(Path, "read_bytes", side_effect=PermissionError("Access denied")):
             with caplog.at_level(logging.WARNING):
-                result = await adapter._fallback_analyze(0.0)
+                result = await adapter._fallback_analyze(0)
 
         # Should complete successfully (skipping problematic files)
         assert result["status"] in ("pass", "warn", "fail")
@@ -172,18 +172,13 @@ class TestFallbackAnalyzeExceptions:
     @pytest.mark.asyncio
     async def test_unicode_error_logs_and_skips(self, tmp_path, caplog):
         """Unicode decode errors should log debug and skip file."""
-        # Create a file we'll mock to raise UnicodeDecodeError
-        (tmp_path / "test.py").write_text("# TODO: test")
+        # Create a file that is not valid UTF-8
+        (tmp_path / "test.py").write_bytes(b"\xff\xfe# TODO: test")
 
         adapter = TechDebtAdapter(str(tmp_path))
 
-        with patch.object(
-            Path,
-            "read_text",
-            side_effect=UnicodeDecodeError("utf-8", b"\xff\xfe", 0, 1, "invalid"),
-        ):
-            with caplog.at_level(logging.DEBUG):
-                result = await adapter._fallback_analyze(0.0)
+        with caplog.at_level(logging.DEBUG):
+            result = await adapter._fallback_analyze(0)
 
         # Should complete successfully
         assert result["status"] in ("pass", "warn", "fail")
@@ -197,9 +192,9 @@ class TestFallbackAnalyzeExceptions:
 
         adapter = TechDebtAdapter(str(tmp_path))
 
-        with patch.object(Path, "read_text", side_effect=OSError("Disk error")):
+        with patch.object(Path, "read_bytes", side_effect=OSError("Disk error")):
             with caplog.at_level(logging.WARNING):
-                result = await adapter._fallback_analyze(0.0)
+                result = await adapter._fallback_analyze(0)
 
         # Should complete successfully
         assert result["status"] in ("pass", "warn", "fail")
@@ -211,7 +206,7 @@ class TestFallbackAnalyzeExceptions:
         """Fallback analysis should successfully find tech debt markers."""
         adapter = TechDebtAdapter(str(temp_project))
 
-        result = await adapter._fallback_analyze(0.0)
+        result = await adapter._fallback_analyze(0)
 
         # Should find the TODO and FIXME markers
         assert result["findings_count"] >= 2
@@ -309,9 +304,9 @@ class TestLoggingAndErrorPropagation:
 
         adapter = TechDebtAdapter(str(tmp_path))
 
-        with patch.object(Path, "read_text", side_effect=PermissionError("Denied")):
+        with patch.object(Path, "read_bytes", side_effect=PermissionError("Denied")):
             with caplog.at_level(logging.WARNING):
-                await adapter._fallback_analyze(0.0)
+                await adapter._fallback_analyze(0)
 
         # Should log the error
         warning_logs = [r for r in caplog.records if r.levelno >= logging.WARNING]
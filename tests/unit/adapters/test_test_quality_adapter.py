@@ -0,0 +1,98 @@
+"""Tests for test_quality_adapter.py file analysis.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agents.code_inspection.adapters import test_quality_adapter
+
+ANALYZER_PATH = "empathy_software_plugin.wizards.testing.quality_analyzer.TestQualityAnalyzer"
+
+
+@pytest.fixture
+def temp_project(tmp_path):
+    """Create a temporary project with a few test files."""
+    (tmp_path / "tests").mkdir()
+    for i in range(4):
+        (tmp_path / "tests" / f"test_module_{i}.py").write_text(f"def test_{i}(): pass")
+    return tmp_path
+
+
+def make_report(file_path):
+    """Build a report with one weak-assertion issue for the given file."""
+    issue = SimpleNamespace(
+        severity="medium",
+        line_number=1,
+        issue_type="WEAK_ASSERTION",
+        description=f"Weak assertion in {file_path}",
+        code_snippet="assert True",
+        confidence=0.9,
+        suggestion="",
+    )
+    return SimpleNamespace(issues=[issue])
+
+
+class TestConcurrentAnalysis:
+    """Test the concurrent per-file analysis."""
+
+    @pytest.mark.asyncio
+    async def test_every_file_analyzed(self, temp_project):
+        """Each test file is analyzed once and reported with a sequential ID."""
+        analyzer = Mock()
+        analyzer.analyze_test_file = Mock(side_effect=make_report)
+        adapter = test_quality_adapter.TestQualityAdapter(
+            str(temp_project),
+            config={"max_concurrency": 2},
+        )
+
+        with patch(ANALYZER_PATH, return_value=analyzer):
+            result = await adapter.analyze()
+
+        assert analyzer.analyze_test_file.call_count == 4
+        assert result["findings_count"] == 4
+        assert result["metadata"]["files_analyzed"] == 4
+        assert [f["finding_id"] for f in result["findings"]] == [f"tq_{i}" for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_failing_file_is_skipped(self, temp_project):
+        """A file the analyzer cannot handle does not stop the others."""
+
+        def analyze_test_file(file_path):
+            if file_path.endswith("test_module_0.py"):
+                raise SyntaxError("invalid syntax")
+            return make_report(file_path)
+
+        analyzer = Mock()
+        analyzer.analyze_test_file = Mock(side_effect=analyze_test_file)
+        adapter = test_quality_adapter.TestQualityAdapter(str(temp_project))
+
+        with patch(ANALYZER_PATH, return_value=analyzer):
+            result = await adapter.analyze()
+
+        assert result["status"] != "error"
+        assert result["findings_count"] == 3
+        assert result["metadata"]["files_analyzed"] == 4
+
+
+class TestAnalysisCache:
+    """Test the content-hash cache of per-file issues."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_served_from_cache(self, temp_project):
+        """A second run does not re-analyze unchanged files."""
+        analyzer = Mock()
+        analyzer.analyze_test_file = Mock(side_effect=make_report)
+        adapter = test_quality_adapter.TestQualityAdapter(str(temp_project))
+
+        with patch(ANALYZER_PATH, return_value=analyzer):
+            first = await adapter.analyze()
+            second = await adapter.analyze()
+
+        assert analyzer.analyze_test_file.call_count == 4
+        assert second["metadata"]["cache_hits"] == 4
+        assert second["findings"] == first["findings"]
@@ -0,0 +1,136 @@
+"""Tests for the progress server's per-client outboxes.
+
+Copyright 2025 Smart AI Memory, LLC
+Licensed under Fair Source 0.9
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("websockets")
+
+from empathy_os.workflows.progress import ProgressStatus, ProgressUpdate  # noqa: E402
+from empathy_os.workflows.progress_server import (  # noqa: E402
+    ProgressServer,
+    ProgressServerConfig,
+)
+
+
+class FakeClient:
+    """In-memory stand-in for a server-side WebSocket connection."""
+
+    def __init__(self, incoming=()):
+        self.sent: list[str] = []
+        self.close_code: int | None = None
+        # Cleared to make send() stall like a client that stopped reading
+        self.send_gate = asyncio.Event()
+        self.send_gate.set()
+        self._incoming: asyncio.Queue = asyncio.Queue()
+        for message in incoming:
+            self._incoming.put_nowait(message)
+
+    async def send(self, message: str) -> None:
+        await self.send_gate.wait()
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.close_code = code
+        self.disconnect()
+
+    def disconnect(self) -> None:
+        """End the client's incoming message stream."""
+        self._incoming.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self._incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+def _update(index: int) -> ProgressUpdate:
+    return ProgressUpdate(
+        workflow="test",
+        workflow_id="wf-1",
+        current_stage=f"stage{index}",
+        stage_index=index,
+        total_stages=10,
+        status=ProgressStatus.RUNNING,
+        message="working",
+    )
+
+
+async def _settle() -> None:
+    """Let the connection handler and writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _wait_for_sent(client: FakeClient, count: int) -> None:
+    """Wait until the writer has sent count frames to the client."""
+    while len(client.sent) < count:
+        await asyncio.sleep(0)
+
+
+class TestOutbox:
+    """Test that every frame to a client goes through its outbox."""
+
+    @pytest.mark.asyncio
+    async def test_welcome_frame_arrives_first(self):
+        """Replies to messages already waiting are sent after the welcome frame."""
+        server = ProgressServer(ProgressServerConfig())
+        client = FakeClient(incoming=['{"type":"ping"}', '{"type": "get_status"}'])
+
+        handler = asyncio.create_task(server._handle_connection(client))
+        await asyncio.wait_for(_wait_for_sent(client, 3), timeout=5)
+        client.disconnect()
+        await handler
+        await _settle()
+
+        types = [json.loads(message)["type"] for message in client.sent]
+        assert types == ["connected", "pong", "status"]
+
+    @pytest.mark.asyncio
+    async def test_slow_client_disconnected_when_queue_full(self):
+        """A client whose outbox reaches send_queue_size is closed with 1013."""
+        server = ProgressServer(ProgressServerConfig(send_queue_size=3, send_timeout=60))
+        client = FakeClient()
+        client.send_gate.clear()
+
+        handler = asyncio.create_task(server._handle_connection(client))
+        await _settle()
+        # The writer is stuck sending the welcome frame, so these queue up
+        for index in range(3):
+            await server.broadcast(_update(index))
+        assert client in server._outboxes
+
+        await server.broadcast(_update(3))
+        assert client not in server._outboxes
+
+        client.send_gate.set()
+        await asyncio.wait_for(handler, timeout=5)
+        await _settle()
+        assert client.close_code == 1013
+        # Queued frames were discarded rather than sent to the dropped client
+        assert [json.loads(message)["type"] for message in client.sent] == ["connected"]
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_closes_client(self):
+        """A send that exceeds send_timeout closes the client with 1013."""
+        server = ProgressServer(ProgressServerConfig(send_timeout=0.05))
+        client = FakeClient()
+        client.send_gate.clear()
+
+        handler = asyncio.create_task(server._handle_connection(client))
+        await asyncio.wait_for(handler, timeout=5)
+        await _settle()
+
+        assert client.close_code == 1013
+        assert client.sent == []
+        assert not server._clients
+        assert not server._outboxes